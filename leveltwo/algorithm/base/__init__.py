@@ -1,5 +1,7 @@
-from .base import MazeSolvingAlgorithm, Deadend, Visited
+from .base import MazeSolvingAlgorithm, PathfindingAlgorithm, Deadend, Visited, Position
 
 from .manual import Manual
 from .tremaux import Tremaux
-from .astar import Astar
+from .astar import Astar, WeightedAstar
+from .distance_field import DistanceField
+from .jps import Jps
@@ -1,8 +1,232 @@
+import heapq
+
 from abc import ABC
+from itertools import count
+from typing import Dict, Generator, List, Optional, Tuple
+
+import numpy as np
+
+from .base import PathfindingAlgorithm, Position
 
-from .base import MazeSolvingAlgorithm
+from ...enums import Effects
+from ...graph import LevelGraph
 
 
-class Astar(MazeSolvingAlgorithm, ABC):
+class Astar(PathfindingAlgorithm, ABC):
+
+    """
+    A* search over the graph of the level (see `LevelGraph`).
+    Subclasses provide the heuristic, which depends on the disposition.
+    """
 
     name = "astar"
+
+    # Cost of moving from a cell to an adjacent one.
+    step_cost = 10
+
+    # Whether moving to a cell costs `step_cost` times the cost of its object
+    # (see `GenericObject.cost`), instead of `step_cost` whatever the object.
+    weighted = False
+
+    # Whether to search from the starting and the arrival points at once
+    # (see `search_bidirectional()`), which explores fewer cells on mazes.
+    # Can be set per instance with the `bidirectional` keyword argument.
+    bidirectional = False
+
+    def __init__(self, *args, bidirectional: Optional[bool] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if bidirectional is not None:
+            self.bidirectional = bidirectional
+        self.graph = LevelGraph(self.level, traversable=self.get_walkable_mask())
+        # Lowest cost of a move, by which the heuristics multiply the distances
+        # so that they never overestimate the cost.
+        self.min_step_cost: int = self.step_cost
+        if self.weighted and self.graph.edges_number > 0:
+            self.min_step_cost = self.step_cost * int(self.graph.weights.min())
+
+    def get_walkable_mask(self) -> np.array:
+        """
+        Returns a boolean array indicating which cells the path can go through.
+        """
+        return self.level.traversable_mask
+
+    def get_heuristic(self, x: int, y: int, target: Optional[Position] = None) -> int:
+        """
+        Returns an estimation of the cost from the cell at `x` and `y` to `target`
+        (by default, the arrival point), which must never be higher than the actual cost.
+        """
+        raise NotImplementedError()
+
+    def search(self) -> Generator[Position, None, None]:
+        """
+        Runs the search, yielding each cell as it is expanded (useful for animations).
+        Once the generator is exhausted, `self.path` holds the path found.
+
+        The open set is a heap with lazy deletion: when a shorter way to a cell
+        is found, a new entry is pushed, and the outdated one is skipped when popped.
+        The best known cost of each node is kept in a dictionary,
+        which gives constant time membership tests.
+        """
+        indptr, indices, weights = self.graph.get_adjacency_lists()
+        s_y = self.graph.shape[1]
+        step_cost = self.step_cost
+        weighted = self.weighted
+        get_heuristic = self.get_heuristic
+
+        start = self.graph.get_node(*self.start)
+        end = self.graph.get_node(*self.end)
+        best_g: Dict[int, int] = {start: 0}
+        parents: Dict[int, Optional[int]] = {start: None}
+        closed = set()
+        # Among the nodes with equal `f`, those closest to the arrival point (lowest `h`)
+        # are expanded first: on open levels, many paths are as short, and this avoids exploring all of them.
+        # The counter then breaks the remaining ties in the order the nodes were found.
+        tie_breaker = count()
+        h = get_heuristic(*self.start)
+        opened = [(h, h, next(tie_breaker), start)]
+
+        while opened:
+            _, _, _, node = heapq.heappop(opened)
+            if node in closed:
+                # Outdated entry
+                continue
+            closed.add(node)
+            self.expanded_nodes += 1
+            yield divmod(node, s_y)
+
+            if node == end:
+                self.path = self.reconstruct_path(parents, end)
+                return
+
+            node_g = best_g[node]
+            for edge in range(indptr[node], indptr[node + 1]):
+                adj_node = indices[edge]
+                if adj_node in closed:
+                    continue
+                g = node_g + (step_cost * weights[edge] if weighted else step_cost)
+                if g < best_g.get(adj_node, float('inf')):
+                    best_g[adj_node] = g
+                    parents[adj_node] = node
+                    h = get_heuristic(*divmod(adj_node, s_y))
+                    heapq.heappush(opened, (g + h, h, next(tie_breaker), adj_node))
+
+        # The arrival point cannot be reached
+        self.path = []
+
+    def search_bidirectional(self) -> Generator[Position, None, None]:
+        """
+        Runs a search from the starting point and another one from the arrival point,
+        the latter following the edges backwards, and yields each cell as it is expanded.
+        Once the generator is exhausted, `self.path` holds the path found.
+
+        Both searches use the average of the two heuristics as potential:
+        `(h_end(n) - h_start(n)) / 2` forward, and its opposite backward,
+        so that they are consistent with each other. Keys are doubled to stay integers.
+        Each time a search reaches a node the other one has reached, the path through them
+        is a candidate. The best candidate is the shortest path once the lowest keys
+        of both open sets add up to at least (twice) its cost.
+        """
+        indptr, indices, weights = self.graph.get_adjacency_lists()
+        s_y = self.graph.shape[1]
+        step_cost = self.step_cost
+        weighted = self.weighted
+        get_heuristic = self.get_heuristic
+        # Cost of entering each cell, used by the backward search
+        costs = self.level.cost_grid.ravel().tolist() if weighted else None
+
+        def get_potential(node: int) -> int:
+            x, y = divmod(node, s_y)
+            return get_heuristic(x, y) - get_heuristic(x, y, self.start)
+
+        start = self.graph.get_node(*self.start)
+        end = self.graph.get_node(*self.end)
+        # Forward search, then backward search
+        best_g: Tuple[Dict[int, int], Dict[int, int]] = ({start: 0}, {end: 0})
+        parents: Tuple[Dict[int, Optional[int]], Dict[int, Optional[int]]] = ({start: None}, {end: None})
+        closed = (set(), set())
+        signs = (1, -1)
+        # As in `search()`, ties between equal keys are broken in favor of the nodes
+        # closest to the target of each search, that is, the ones with the highest `g`.
+        tie_breaker = count()
+        opened = ([(get_potential(start), 0, next(tie_breaker), start)],
+                  [(-get_potential(end), 0, next(tie_breaker), end)])
+
+        # Cost of the best path found, and the nodes through which it goes from one search to the other
+        best_cost = 0 if start == end else float('inf')
+        meeting_nodes = (start, end)
+
+        while opened[0] and opened[1]:
+            if opened[0][0][0] + opened[1][0][0] >= 2 * best_cost:
+                break
+            # Expand the node with the lowest key of both searches
+            side = 0 if opened[0][0][0] <= opened[1][0][0] else 1
+            _, _, _, node = heapq.heappop(opened[side])
+            if node in closed[side]:
+                # Outdated entry
+                continue
+            closed[side].add(node)
+            self.expanded_nodes += 1
+            yield divmod(node, s_y)
+
+            side_g, other_g = best_g[side], best_g[1 - side]
+            sign = signs[side]
+            node_g = side_g[node]
+            if side == 1:
+                # Backwards, the edges lead to `node`: their cost is the one of entering it
+                move_cost = step_cost * costs[node] if weighted else step_cost
+            for edge in range(indptr[node], indptr[node + 1]):
+                adj_node = indices[edge]
+                if adj_node in closed[side]:
+                    continue
+                if side == 0:
+                    move_cost = step_cost * weights[edge] if weighted else step_cost
+                g = node_g + move_cost
+                if g < side_g.get(adj_node, float('inf')):
+                    side_g[adj_node] = g
+                    parents[side][adj_node] = node
+                    heapq.heappush(opened[side],
+                                   (2 * g + sign * get_potential(adj_node), -g, next(tie_breaker), adj_node))
+                    if adj_node in other_g and g + other_g[adj_node] < best_cost:
+                        best_cost = g + other_g[adj_node]
+                        meeting_nodes = (node, adj_node) if side == 0 else (adj_node, node)
+
+        if best_cost == float('inf'):
+            # The arrival point cannot be reached
+            self.path = []
+            return
+        forward_node, backward_node = meeting_nodes
+        path = self.reconstruct_path(parents[0], forward_node)
+        if backward_node != forward_node:
+            path.extend(reversed(self.reconstruct_path(parents[1], backward_node)))
+        self.path = path
+
+    def reconstruct_path(self, parents: Dict[int, Optional[int]], end: int) -> List[Position]:
+        node = end
+        path = []
+        while node is not None:
+            path.append(self.graph.get_position(node))
+            node = parents[node]
+        path.reverse()
+        return path
+
+    def solve(self) -> List[Position]:
+        search = self.search_bidirectional if self.bidirectional else self.search
+        for _ in search():
+            pass
+        return self.path
+
+
+class WeightedAstar(Astar, ABC):
+
+    """
+    A* search for the path taking the fewest steps (game ticks) to walk:
+    moving to a cell costs the cost of its object, e.g. mud stuns the character for a step,
+    and cells killing the character are never walked on.
+    """
+
+    name = "weighted astar"
+
+    weighted = True
+
+    def get_walkable_mask(self) -> np.array:
+        return self.level.traversable_mask & (self.level.effect_grid != Effects.PLAYER_KILL.value)
@@ -1,16 +1,22 @@
+from typing import Iterable, List, Optional, Tuple
+
+from ...enums import Effects
 from ...object import GenericObject
 from ...database import Database
 from ...level import GenericLevel
 from ...character import Character
 
 
+Position = Tuple[int, int]
+
+
 class Visited(GenericObject):
     """
     Visited: signals the way we came from.
     """
-    def __init__(self, identifier, effect, traversable, min_instances, max_instances):
+    def __init__(self, identifier, effect, traversable, min_instances, max_instances, cost=None):
         name = Visited.__name__.lower()
-        super().__init__(identifier, name, effect, traversable, min_instances, max_instances)
+        super().__init__(identifier, name, effect, traversable, min_instances, max_instances, cost)
 
     @classmethod
     def from_existing(cls, obj: GenericObject):
@@ -22,7 +28,8 @@ class Visited(GenericObject):
         traversable = obj.traversable
         min_instances = obj.min_instances
         max_instances = obj.max_instances
-        return cls(identifier, effect, traversable, min_instances, max_instances)
+        cost = obj.cost
+        return cls(identifier, effect, traversable, min_instances, max_instances, cost)
 
 
 class Deadend(GenericObject):
@@ -30,9 +37,9 @@ class Deadend(GenericObject):
     Deadend: signals a way that has already been visited, and leads to nowhere.
     It is somewhat considered a wall.
     """
-    def __init__(self, identifier, effect, traversable, min_instances, max_instances):
+    def __init__(self, identifier, effect, traversable, min_instances, max_instances, cost=None):
         name = Deadend.__name__.lower()
-        super().__init__(identifier, name, effect, traversable, min_instances, max_instances)
+        super().__init__(identifier, name, effect, traversable, min_instances, max_instances, cost)
 
     @classmethod
     def from_existing(cls, obj: GenericObject):
@@ -44,23 +51,118 @@ class Deadend(GenericObject):
         traversable = False
         min_instances = obj.min_instances
         max_instances = obj.max_instances
-        return cls(identifier, effect, traversable, min_instances, max_instances)
+        cost = obj.cost
+        return cls(identifier, effect, traversable, min_instances, max_instances, cost)
 
 
 class MazeSolvingAlgorithm:
 
     def __init__(self, level: GenericLevel, character: Character):
         self.level = level
-        self.level.construct_object_content()
         self.character = character
 
-        db = Database()
-        self.objects = db.get_all_objects()
+        # Reuse the objects already attached to the level if any,
+        # so that algorithms can run on levels that are not in the database.
+        if self.level.objects is None:
+            db = Database()
+            self.level.set_objects(db.get_all_objects())
+        self.objects = self.level.objects
 
         self._running = True
+        self._solvable = True
+        # Number of cells the algorithm had to look at.
+        self.expanded_nodes: int = 0
 
     def is_running(self) -> bool:
         return self._running
 
+    def is_solvable(self) -> bool:
+        """
+        Returns False if the algorithm came to the conclusion
+        that the level cannot be solved.
+        """
+        return self._solvable
+
     def run_one_step(self, *args, **kwargs):
         raise NotImplementedError()
+
+    def get_mark(self, x: int, y: int) -> Optional[str]:
+        """
+        Returns the name of the mark (e.g. 'visited') the algorithm left on the cell,
+        None if there is none.
+        Marks are only left on the cell the character is leaving,
+        so that the display only has to redraw the cells the character moved from and to.
+        """
+        return None
+
+    def get_marked_cells(self) -> Iterable[Position]:
+        """
+        Returns the positions of all the cells the algorithm left a mark on.
+        """
+        return []
+
+    def move_character_to(self, x: int, y: int) -> bool:
+        """
+        Moves the character to the cell at `x` and `y`,
+        and applies the effect of the object it lands on.
+        Stops the algorithm if the character dies or reaches the arrival point.
+
+        :return bool: Whether the character actually moved ; it does not if it is stunned.
+        """
+        obj: GenericObject = self.level.get_cell_object(x, y)
+        self.character.move_and_handle_object_effect(x, y, obj)
+        moved = self.character.location == (x, y)
+        if not self.character.is_alive():
+            self._running = False
+        elif moved and obj.effect == Effects.LEVEL_FINISH:
+            self._running = False
+        return moved
+
+
+class PathfindingAlgorithm(MazeSolvingAlgorithm):
+
+    """
+    Algorithm which computes the whole path beforehand (see `solve()`),
+    and then walks the character along it, one cell per step.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        start_x, start_y = self.level.get_starting_point_position()
+        self.start: Position = (int(start_x), int(start_y))
+        end_x, end_y = self.level.get_arrival_point_position()
+        self.end: Position = (int(end_x), int(end_y))
+
+        # Computed by `solve()`, then followed by `run_one_step()`.
+        # Empty if there is no path from the start to the end.
+        self.path: Optional[List[Position]] = None
+        self._path_index: int = 1  # The first cell of the path is the starting point
+
+    def solve(self) -> List[Position]:
+        """
+        Computes the path in one call, stores it in `self.path` and returns it.
+        The path goes from the starting point to the arrival point (both included),
+        and is empty if there is no solution.
+        """
+        raise NotImplementedError()
+
+    def run_one_step(self) -> None:
+        """
+        Moves the character one cell further along the path.
+        The path is computed on the first call.
+        """
+        if self.path is None:
+            self.solve()
+
+        if not self.path:
+            self._solvable = False
+            self._running = False
+            return
+
+        if self._path_index >= len(self.path):
+            self._running = False
+            return
+
+        next_x, next_y = self.path[self._path_index]
+        if self.move_character_to(next_x, next_y):
+            self._path_index += 1
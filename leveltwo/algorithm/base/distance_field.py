@@ -0,0 +1,79 @@
+from abc import ABC
+from typing import List, Tuple
+
+import numpy as np
+
+from .base import PathfindingAlgorithm, Position
+
+
+class DistanceField(PathfindingAlgorithm, ABC):
+
+    """
+    Computes, for every cell of the level, its distance (in steps) to the arrival point.
+    The distances are computed all at once with array operations:
+    at each iteration, the whole frontier is expanded by shifting it in every direction.
+    The path is then read by descending the distances from the starting point.
+    """
+
+    name = "distance field"
+
+    # Offsets, on the `x` and `y` axis, to the adjacent cells.
+    # Must be symmetric: if `(x, y)` is in, `(-x, -y)` must be too.
+    neighbour_offsets: Tuple[Tuple[int, int], ...]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Distance of each cell to the arrival point, `-1` if it cannot be reached.
+        self.distances = None
+
+    def compute_distances(self) -> np.array:
+        traversable = self.level.traversable_mask
+        s_x, s_y = traversable.shape
+
+        distances = np.full(traversable.shape, -1, dtype='int32')
+        distances[self.end] = 0
+        frontier = np.zeros(traversable.shape, dtype='bool')
+        frontier[self.end] = True
+        expanded = np.empty_like(frontier)
+
+        distance = 0
+        while frontier.any():
+            distance += 1
+            # Shift the frontier in each direction.
+            expanded.fill(False)
+            for offset_x, offset_y in self.neighbour_offsets:
+                expanded[max(offset_x, 0):s_x + min(offset_x, 0), max(offset_y, 0):s_y + min(offset_y, 0)] |= \
+                    frontier[max(-offset_x, 0):s_x + min(-offset_x, 0), max(-offset_y, 0):s_y + min(-offset_y, 0)]
+            # Only keep the cells we can walk on, and that we did not reach before.
+            np.logical_and(expanded, traversable, out=frontier)
+            frontier &= distances < 0
+            distances[frontier] = distance
+
+        self.distances = distances
+        self.expanded_nodes = int(np.count_nonzero(distances >= 0))
+        return distances
+
+    def solve(self) -> List[Position]:
+        distances = self.compute_distances()
+        s_x, s_y = distances.shape
+
+        if distances[self.start] < 0:
+            self.path = []
+            return self.path
+
+        # Descend the distances from the start, down to the arrival point.
+        x, y = self.start
+        path = [(x, y)]
+        distance = distances[x, y]
+        while distance > 0:
+            for offset_x, offset_y in self.neighbour_offsets:
+                adj_x = x + offset_x
+                adj_y = y + offset_y
+                if 0 <= adj_x < s_x and 0 <= adj_y < s_y and distances[adj_x, adj_y] == distance - 1:
+                    x, y = adj_x, adj_y
+                    break
+            path.append((x, y))
+            distance -= 1
+
+        self.path = path
+        return self.path
@@ -0,0 +1,15 @@
+from abc import ABC
+
+from .base import PathfindingAlgorithm
+
+
+class Jps(PathfindingAlgorithm, ABC):
+
+    """
+    Jump Point Search: an A* search which, instead of expanding every adjacent cell,
+    "jumps" in straight lines over the cells where all the paths are equivalent,
+    and only pushes to the open set the jump points, where the way branches.
+    How to jump depends on the disposition, and is implemented by the subclasses.
+    """
+
+    name = "jps"
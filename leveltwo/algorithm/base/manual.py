@@ -2,7 +2,41 @@ from abc import ABC
 
 from .base import MazeSolvingAlgorithm
 
+from ...graph import LevelGraph
+from ...topology import Offsets
+
 
 class Manual(MazeSolvingAlgorithm, ABC):
 
     name = "manual"
+
+    # Offsets, on the `x` and `y` axis, of the cell reached in each direction.
+    # Their index is the direction passed to `move_character()`.
+    neighbour_offsets: Offsets
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.graph = LevelGraph(self.level, self.neighbour_offsets)
+
+    def move_character(self, direction: int, amount: int = 1) -> None:
+        """
+        Changes the position of the character by `amount` cell(s) in the direction passed.
+        The character stops before the first cell it cannot walk on.
+
+        :param int direction: Direction the character should move to,
+                              index of the offset in `neighbour_offsets`.
+        :param int amount: How many cells it will try to move. Default is 1.
+        """
+        if direction not in range(len(self.neighbour_offsets)):
+            raise ValueError(f'Invalid direction {direction!r}, should be an integer '
+                             f'between 0 and {len(self.neighbour_offsets) - 1} included.')
+
+        for _ in range(amount):
+            node = self.graph.get_node(*self.character.location)
+            next_node = self.graph.get_neighbour(node, direction)
+            if next_node is None:
+                # Out of the level, or not traversable
+                break
+            self.move_character_to(*self.graph.get_position(next_node))
+            if not self.is_running():
+                break
@@ -1,8 +1,115 @@
 from abc import ABC
+from typing import Iterable, Optional, Tuple
 
-from .base import MazeSolvingAlgorithm
+import numpy as np
+
+from .base import MazeSolvingAlgorithm, Position
+
+from ...enums import Effects
+from ...graph import LevelGraph
+from ...topology import Offsets
 
 
 class Tremaux(MazeSolvingAlgorithm, ABC):
 
+    """
+    Trémaux's algorithm: the character explores the level cell by cell, marking its way.
+    It enters, in priority, the arrival point, then unmarked cells, cheapest first.
+    When there is none left around it, it goes back the way it first came,
+    marking the cell it leaves as a dead-end, never to be entered again.
+    Cells already marked are never entered going forward, so loops are handled too,
+    and the whole region is explored in the worst case.
+    Cells killing the character are avoided.
+
+    Marks are held in arrays, along with the direction each cell was first entered from,
+    so that a step does not allocate anything.
+    """
+
     name = "tremaux"
+
+    # Offsets, on the `x` and `y` axis, to the adjacent cells.
+    # When several cells have the same priority, the first one in this order is chosen.
+    neighbour_offsets: Offsets
+
+    # Marks left on the cells
+    unmarked = 0
+    visited = 1
+    deadend = 2
+    # Names of the marks, by value (see `get_mark()`)
+    mark_names: Tuple[Optional[str], ...] = (None, 'visited', 'deadend')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        walkable = self.level.traversable_mask & (self.level.effect_grid != Effects.PLAYER_KILL.value)
+        self.graph = LevelGraph(self.level, self.neighbour_offsets, traversable=walkable)
+        self.indptr, self.indices, self.weights = self.graph.get_adjacency_lists()
+        s_y = self.graph.shape[1]
+        self.flat_offsets = [offset_x * s_y + offset_y for offset_x, offset_y in self.neighbour_offsets]
+        self.directions = self.graph.directions.tolist()
+        # Index of the opposite of each direction
+        self.opposites = [self.neighbour_offsets.index((-offset_x, -offset_y))
+                          for offset_x, offset_y in self.neighbour_offsets]
+        self.end = self.graph.get_node(*self.level.get_arrival_point_position())
+
+        # Mark of each cell, left when the character leaves it.
+        self.marks = np.zeros(self.graph.shape, dtype='int8')
+        # Direction leading back to the cell each cell was first entered from, `-1` if none.
+        self.parents = np.full(self.graph.shape, -1, dtype='int8')
+        # Flat views on the arrays above
+        self._flat_marks = self.marks.reshape(-1)
+        self._flat_parents = self.parents.reshape(-1)
+
+    def get_mark(self, x: int, y: int) -> Optional[str]:
+        return self.mark_names[self.marks[x, y]]
+
+    def get_marked_cells(self) -> Iterable[Position]:
+        return [tuple(position) for position in np.argwhere(self.marks).tolist()]
+
+    def get_next_edge(self, node: int) -> int:
+        """
+        Returns the edge (see `LevelGraph`) to follow from `node` going forward,
+        `-1` if all the adjacent cells are marked.
+        """
+        marks, weights, end = self._flat_marks, self.weights, self.end
+        best_edge = -1
+        best_cost = None
+        for edge in range(self.indptr[node], self.indptr[node + 1]):
+            adj_node = self.indices[edge]
+            if adj_node == end:
+                return edge
+            if marks[adj_node] == self.unmarked and (best_edge < 0 or weights[edge] < best_cost):
+                best_edge = edge
+                best_cost = weights[edge]
+        return best_edge
+
+    def run_one_step(self) -> None:
+        node = self.graph.get_node(*self.character.location)
+        self.expanded_nodes += 1
+
+        edge = self.get_next_edge(node)
+        if edge >= 0:
+            next_node = self.indices[edge]
+        else:
+            # Go back the way we first came
+            direction = self._flat_parents[node]
+            if direction < 0:
+                # Back to the starting point, with nothing left to explore:
+                # the arrival point cannot be reached.
+                self.character.append_location_to_path()
+                self._solvable = False
+                self._running = False
+                return
+            next_node = node + self.flat_offsets[direction]
+
+        if not self.move_character_to(*self.graph.get_position(next_node)):
+            # Stunned, it will try again on the next step
+            return
+
+        # Mark the cell we left
+        if edge >= 0:
+            # Forward, the next cell is unmarked: it is entered for the first time
+            if self._flat_marks[node] == self.unmarked:
+                self._flat_marks[node] = self.visited
+            self._flat_parents[next_node] = self.opposites[self.directions[edge]]
+        else:
+            self._flat_marks[node] = self.deadend
@@ -1 +1,4 @@
 from .manual import ManualHexagonal
+from .tremaux import TremauxHexagonal
+from .astar import AstarHexagonal, WeightedAstarHexagonal
+from .distance_field import DistanceFieldHexagonal
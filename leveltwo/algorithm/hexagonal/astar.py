@@ -0,0 +1,20 @@
+from typing import Optional
+
+from ..base import Astar, WeightedAstar, Position
+
+
+class AstarHexagonal(Astar):
+
+    name = "astar"
+
+    def get_heuristic(self, x: int, y: int, target: Optional[Position] = None) -> int:
+        # Number of moves between the cells, with the offsets of the hexagonal disposition
+        # (see `leveltwo.topology`), along which the axis `x` and `y` increase together.
+        target_x, target_y = self.end if target is None else target
+        d_x, d_y = x - target_x, y - target_y
+        return self.min_step_cost * ((abs(d_x) + abs(d_y) + abs(d_x - d_y)) // 2)
+
+
+class WeightedAstarHexagonal(WeightedAstar, AstarHexagonal):
+
+    name = "weighted astar"
@@ -0,0 +1,9 @@
+from ..base import DistanceField
+
+from ...topology import get_neighbour_offsets
+
+
+class DistanceFieldHexagonal(DistanceField):
+
+    # Up, left-up, left-down, down, right-down, right-up
+    neighbour_offsets = get_neighbour_offsets('hexagonal')
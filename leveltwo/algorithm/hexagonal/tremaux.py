@@ -0,0 +1,10 @@
+from ..base import Tremaux
+
+from ...topology import get_neighbour_offsets
+
+
+class TremauxHexagonal(Tremaux):
+
+    # Up, left-up, left-down, down, right-down, right-up: when several cells
+    # have the same priority, the first one in this order is chosen.
+    neighbour_offsets = get_neighbour_offsets('hexagonal')
@@ -1,3 +1,5 @@
 from .tremaux import TremauxSquare
 from .manual import ManualSquare
-from .astar import AstarSquare
+from .astar import AstarSquare, WeightedAstarSquare
+from .distance_field import DistanceFieldSquare
+from .jps import JpsSquare
@@ -0,0 +1,9 @@
+from ..base import DistanceField
+
+from ...topology import get_neighbour_offsets
+
+
+class DistanceFieldSquare(DistanceField):
+
+    # Up, left, down, right
+    neighbour_offsets = get_neighbour_offsets('square')
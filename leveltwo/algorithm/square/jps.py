@@ -0,0 +1,198 @@
+import heapq
+
+from itertools import count
+from typing import Dict, Generator, List, Optional
+
+import numpy as np
+
+from ..base import Jps, Position
+
+
+class JpsSquare(Jps):
+
+    """
+    Jump Point Search on 4-connected square levels.
+
+    Instead of pushing every adjacent cell to the open set like A*,
+    the search "jumps" in straight lines over cells where all the paths are
+    equivalent, and only stops on jump points:
+    - Moving along `x`, it stops where a cell opens on its side
+      (a forced neighbour), or where a jump along `y` from the current cell finds a jump point.
+    - Moving along `y`, it only stops on forced neighbours.
+    From a jump point, the search only goes on forward and to the sides.
+
+    This relies on all the cells costing the same: cells whose cost differs (e.g. mud),
+    and the cells next to them, stop the jumps and are expanded in every direction,
+    as A* would.
+    """
+
+    name = "jps"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        s_x, s_y = self.level.content.shape
+        # The grids are padded with a border of walls, so that no bounds check is needed,
+        # and flattened into lists, which are fast to index one item at a time.
+        self.width = s_y + 2
+        walkable = np.zeros((s_x + 2, s_y + 2), dtype='bool')
+        walkable[1:-1, 1:-1] = self.level.traversable_mask
+        costs = np.ones((s_x + 2, s_y + 2), dtype='int64')
+        costs[1:-1, 1:-1] = self.level.cost_grid
+        # Cells whose cost is not the usual one, and their neighbours
+        irregular = walkable & (costs != 1)
+        special = irregular.copy()
+        special[1:, :] |= irregular[:-1, :]
+        special[:-1, :] |= irregular[1:, :]
+        special[:, 1:] |= irregular[:, :-1]
+        special[:, :-1] |= irregular[:, 1:]
+
+        self.walkable: List[bool] = walkable.ravel().tolist()
+        # Walkable cells of the usual cost. When looking for forced neighbours,
+        # the other cells are considered as blocked, as going around them is not equivalent.
+        self.regular: List[bool] = (walkable & ~irregular).ravel().tolist()
+        self.costs: List[int] = costs.ravel().tolist()
+        self.special: List[bool] = (special & walkable).ravel().tolist()
+        self.goal: int = self.get_node(*self.end)
+
+    def get_node(self, x: int, y: int) -> int:
+        return (x + 1) * self.width + (y + 1)
+
+    def get_position(self, node: int) -> Position:
+        x, y = divmod(node, self.width)
+        return x - 1, y - 1
+
+    def get_heuristic(self, node: int) -> int:
+        # Manhattan distance
+        x, y = divmod(node, self.width)
+        goal_x, goal_y = divmod(self.goal, self.width)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    def jump_y(self, node: int, direction: int) -> Optional[int]:
+        """
+        Jumps from `node` along `y` (`direction` being `1` or `-1`),
+        and returns the jump point reached, None if a wall is reached first.
+        """
+        walkable, regular, special, goal = self.walkable, self.regular, self.special, self.goal
+        width = self.width
+        while True:
+            node += direction
+            if not walkable[node]:
+                return
+            if node == goal or special[node]:
+                return node
+            # Forced neighbours: a side opens, which was closed (or irregular) on the previous cell
+            if (walkable[node + width] and not regular[node + width - direction]) \
+                    or (walkable[node - width] and not regular[node - width - direction]):
+                return node
+
+    def jump_x(self, node: int, direction: int) -> Optional[int]:
+        """
+        Jumps from `node` along `x` (`direction` being `1` or `-1`),
+        and returns the jump point reached, None if a wall is reached first.
+        """
+        walkable, regular, special, goal = self.walkable, self.regular, self.special, self.goal
+        offset = direction * self.width
+        while True:
+            node += offset
+            if not walkable[node]:
+                return
+            if node == goal or special[node]:
+                return node
+            # Forced neighbours
+            if (walkable[node + 1] and not regular[node + 1 - offset]) \
+                    or (walkable[node - 1] and not regular[node - 1 - offset]):
+                return node
+            # A jump point can be reached by turning here
+            if self.jump_y(node, 1) is not None or self.jump_y(node, -1) is not None:
+                return node
+
+    def get_directions(self, node: int, parent: Optional[int]) -> List[int]:
+        """
+        Returns the flat offsets of the directions to jump to from `node`:
+        forward and to the sides, or all of them if `node` is special or the starting point.
+        """
+        width = self.width
+        if parent is None or self.special[node]:
+            return [width, -width, 1, -1]
+        if abs(node - parent) >= width:
+            # Moving along `x`
+            forward = width if node > parent else -width
+            return [forward, 1, -1]
+        forward = 1 if node > parent else -1
+        return [forward, width, -width]
+
+    def jump(self, node: int, offset: int) -> Optional[int]:
+        if offset in (1, -1):
+            return self.jump_y(node, offset)
+        return self.jump_x(node, offset // self.width)
+
+    def search(self) -> Generator[Position, None, None]:
+        """
+        Runs the search, yielding each jump point as it is expanded (useful for animations).
+        Once the generator is exhausted, `self.path` holds the path found.
+        The open set is handled like in `Astar.search()`.
+        """
+        costs = self.costs
+        goal = self.goal
+        start = self.get_node(*self.start)
+        best_g: Dict[int, int] = {start: 0}
+        parents: Dict[int, Optional[int]] = {start: None}
+        closed = set()
+        tie_breaker = count()
+        # Among the nodes with equal `f`, those closest to the arrival point are expanded first:
+        # on open levels, many paths are as short, and this avoids exploring all of them.
+        h = self.get_heuristic(start)
+        opened = [(h, h, next(tie_breaker), start)]
+
+        while opened:
+            _, _, _, node = heapq.heappop(opened)
+            if node in closed:
+                # Outdated entry
+                continue
+            closed.add(node)
+            self.expanded_nodes += 1
+            yield self.get_position(node)
+
+            if node == goal:
+                self.path = self.reconstruct_path(parents)
+                return
+
+            for offset in self.get_directions(node, parents[node]):
+                jump_point = self.jump(node, offset)
+                if jump_point is None or jump_point in closed:
+                    continue
+                # The cells jumped over all cost 1, only the jump point may cost more
+                distance = abs(jump_point - node) // abs(offset)
+                g = best_g[node] + distance - 1 + costs[jump_point]
+                if g < best_g.get(jump_point, float('inf')):
+                    best_g[jump_point] = g
+                    parents[jump_point] = node
+                    h = self.get_heuristic(jump_point)
+                    heapq.heappush(opened, (g + h, h, next(tie_breaker), jump_point))
+
+        # The arrival point cannot be reached
+        self.path = []
+
+    def reconstruct_path(self, parents: Dict[int, Optional[int]]) -> List[Position]:
+        """
+        Returns the path through the jump points, with the cells in between.
+        """
+        jump_points = []
+        node = self.goal
+        while node is not None:
+            jump_points.append(node)
+            node = parents[node]
+        jump_points.reverse()
+
+        path = [self.get_position(jump_points[0])]
+        for node, next_node in zip(jump_points, jump_points[1:]):
+            step = self.width if abs(next_node - node) >= self.width else 1
+            if next_node < node:
+                step = -step
+            path.extend(self.get_position(cell) for cell in range(node + step, next_node + step, step))
+        return path
+
+    def solve(self) -> List[Position]:
+        for _ in self.search():
+            pass
+        return self.path
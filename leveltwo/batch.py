@@ -0,0 +1,227 @@
+"""
+Evaluates the maze solving algorithms on many levels, in parallel.
+
+Levels are either read from the database, or generated (see `leveltwo.generation`).
+The (level, algorithm) pairs are split into shards, which are run by a pool of processes.
+Each worker has its own connection to the database, and stores the tests
+of the levels that are in the database by batches, each in a single transaction.
+
+Usage:
+
+    python -m leveltwo.batch --workers 4 --output results.json
+    python -m leveltwo.batch --generator kruskal --sizes 101 201 --seeds 0 1 2 --algorithms astar
+    python -m leveltwo.batch --generator cave --disposition hexagonal
+
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional
+
+from .bench import solvers, solvers_names, generators
+from .level import GenericLevel
+from .runner import HeadlessRunner
+from .database import Database, ReadOnlyDatabase
+
+
+class Job:
+
+    """
+    An algorithm to evaluate on a level.
+
+    Parameters
+    ----------
+
+    algorithm: str
+        Name of the algorithm, key of `leveltwo.bench.solvers` (for the disposition of the level).
+
+    level_id: int, optional
+        Identifier of the level in the database.
+        If not passed, the level is generated with the three next parameters.
+
+    generator: str, optional
+        Name of the generator, key of `leveltwo.bench.generators`.
+
+    size: int, optional
+        Size of the (square) level to generate.
+
+    seed: int, optional
+        Seed of the generator.
+
+    disposition: str
+        Disposition of the level to generate. Default is 'square'.
+
+    """
+
+    def __init__(self, algorithm: str, level_id: Optional[int] = None,
+                 generator: Optional[str] = None, size: Optional[int] = None, seed: Optional[int] = None,
+                 disposition: str = 'square'):
+        self.algorithm = algorithm
+        self.level_id = level_id
+        self.generator = generator
+        self.size = size
+        self.seed = seed
+        self.disposition = disposition
+
+    @property
+    def level_key(self) -> tuple:
+        """
+        Identifies the level, jobs on the same level have the same key.
+        """
+        return self.level_id, self.generator, self.size, self.seed, self.disposition
+
+    def load_level(self, db: Database) -> GenericLevel:
+        if self.level_id is not None:
+            return db.construct_level(self.level_id)
+        generator_class = generators[self.generator]
+        return generator_class((self.size, self.size), self.disposition, self.seed).generate()
+
+
+def run_shard(jobs: List[Job], max_steps: Optional[int] = None,
+              store: bool = True, batch_size: int = 50) -> List[dict]:
+    """
+    Runs the jobs one after the other, and returns their statistics.
+    Executed in the worker processes.
+    Tests are stored `batch_size` at a time, generated levels' tests are not stored.
+    If they are not stored at all, the database is only opened for reading.
+    """
+    db = Database() if store else ReadOnlyDatabase()
+    results = []
+    tests = []
+    level = None
+    level_key = None
+    for job in jobs:
+        if job.level_key != level_key:
+            # Jobs are sorted by level, so each level is loaded once
+            level = job.load_level(db)
+            level_key = job.level_key
+
+        stats = {
+            'algorithm': job.algorithm,
+            'level_id': job.level_id,
+            'generator': job.generator,
+            'size': job.size,
+            'seed': job.seed,
+            'disposition': level.disposition,
+            'pid': os.getpid(),
+        }
+        algorithm_class = solvers[level.disposition].get(job.algorithm)
+        if algorithm_class is None:
+            stats['error'] = f'{job.algorithm} is not available on {level.disposition} levels'
+            results.append(stats)
+            continue
+        start = time.perf_counter()
+        try:
+            result = HeadlessRunner(level, max_steps=max_steps).run(algorithm_class)
+        except ValueError as error:
+            # Invalid level, e.g. without a starting point
+            stats['error'] = str(error)
+            results.append(stats)
+            continue
+        wall_time = time.perf_counter() - start
+
+        stats.update({
+            'solved': result.solved,
+            'wall_time': wall_time,
+            'steps': result.steps_number,
+            'expanded_nodes': result.algorithm.expanded_nodes,
+            'path_length': len(result.path),
+        })
+        results.append(stats)
+
+        if store and level.identifier is not None:
+            tests.append(result.test)
+            if len(tests) >= batch_size:
+                db.store_tests(tests)
+                tests = []
+
+    if tests:
+        db.store_tests(tests)
+    return results
+
+
+def split_in_shards(jobs: List[Job], shards_number: int) -> List[List[Job]]:
+    """
+    Splits the jobs in contiguous shards of similar sizes,
+    after sorting them by level, so that a level is shared by as few workers as possible.
+    """
+    jobs = sorted(jobs, key=lambda job: repr(job.level_key))
+    shards_number = max(min(shards_number, len(jobs)), 1)
+    size, remainder = divmod(len(jobs), shards_number)
+    shards = []
+    start = 0
+    for i in range(shards_number):
+        end = start + size + (1 if i < remainder else 0)
+        shards.append(jobs[start:end])
+        start = end
+    return shards
+
+
+def evaluate(jobs: List[Job], workers: Optional[int] = None, max_steps: Optional[int] = None,
+             store: bool = True, batch_size: int = 50) -> List[dict]:
+    """
+    Runs the jobs on a pool of `workers` processes (by default, one per core),
+    and returns their statistics.
+    """
+    # Make sure the database is initialized before the workers use it.
+    Database()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # A few shards per worker, so that they stay busy until the end
+    shards = split_in_shards(jobs, 4 * workers)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_shard, shard, max_steps, store, batch_size) for shard in shards]
+        for future in as_completed(futures):
+            results.extend(future.result())
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Evaluates the maze solving algorithms in parallel.')
+    parser.add_argument('--algorithms', nargs='+', choices=solvers_names, default=solvers_names)
+    parser.add_argument('--levels', nargs='+', type=int, default=None,
+                        help='Identifiers of the levels in the database (default: all of them).')
+    parser.add_argument('--generator', choices=[name for name, cls in generators.items() if cls is not None],
+                        default=None, help='Evaluate on generated levels instead of those of the database.')
+    parser.add_argument('--disposition', choices=list(solvers), default='square',
+                        help='Disposition of the generated levels.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[51])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--workers', type=int, default=None, help='Number of processes (default: one per core).')
+    parser.add_argument('--max-steps', type=int, default=None)
+    parser.add_argument('--batch-size', type=int, default=50, help='Number of tests stored per transaction.')
+    parser.add_argument('--no-store', action='store_true', help='Do not store the tests in the database.')
+    parser.add_argument('--output', default=None, help='JSON file to write the results to (default: stdout).')
+    args = parser.parse_args(argv)
+
+    if args.generator is None:
+        levels_ids = args.levels
+        if levels_ids is None:
+            levels_ids = [summary.identifier for summary in Database().get_level_summaries()]
+        jobs = [Job(algorithm, level_id=level_id) for level_id in levels_ids for algorithm in args.algorithms]
+    else:
+        jobs = [Job(algorithm, generator=args.generator, size=size, seed=seed, disposition=args.disposition)
+                for size in args.sizes for seed in args.seeds for algorithm in args.algorithms]
+
+    start = time.perf_counter()
+    results = evaluate(jobs, workers=args.workers, max_steps=args.max_steps,
+                       store=not args.no_store, batch_size=args.batch_size)
+    print(f'Evaluated {len(results)} runs in {time.perf_counter() - start:.2f}s', file=sys.stderr)
+
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
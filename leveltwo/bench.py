@@ -0,0 +1,196 @@
+"""
+Benchmarks the maze solving algorithms on generated levels.
+
+Usage:
+
+    python -m leveltwo.bench --sizes 50 100 200 --densities 0.1 0.3 --output bench.json
+
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from datetime import datetime
+from typing import Dict, List, Optional, Type
+
+from .level import GenericLevel
+from .runner import HeadlessRunner
+from .generation import MazeGenerator, RecursiveBacktracker, Kruskal, Wilson, BinaryTree, CellularAutomaton
+from .algorithm.base import MazeSolvingAlgorithm
+from .algorithm.square import TremauxSquare, AstarSquare, WeightedAstarSquare, DistanceFieldSquare, JpsSquare
+from .algorithm.hexagonal import TremauxHexagonal, AstarHexagonal, WeightedAstarHexagonal, DistanceFieldHexagonal
+from .topology import get_cells_mask
+from .database.init.default_objects import all_objects, StartingPoint, ArrivalPoint, Wall
+
+
+# Algorithms benchmarked, by name, for each disposition.
+solvers: Dict[str, Dict[str, Type[MazeSolvingAlgorithm]]] = {
+    'square': {
+        'tremaux': TremauxSquare,
+        'astar': AstarSquare,
+        'weighted-astar': WeightedAstarSquare,
+        'jps': JpsSquare,
+        'distance-field': DistanceFieldSquare,
+    },
+    'hexagonal': {
+        'tremaux': TremauxHexagonal,
+        'astar': AstarHexagonal,
+        'weighted-astar': WeightedAstarHexagonal,
+        'distance-field': DistanceFieldHexagonal,
+    },
+}
+# Names of all the algorithms, whatever the disposition
+solvers_names: List[str] = list(dict.fromkeys(name for algorithms in solvers.values() for name in algorithms))
+
+# Generators of the levels, by name.
+# 'random' levels are made with `generate_random_level()`.
+generators: Dict[str, Optional[Type[MazeGenerator]]] = {
+    'random': None,
+    'backtracker': RecursiveBacktracker,
+    'kruskal': Kruskal,
+    'wilson': Wilson,
+    'binary-tree': BinaryTree,
+    'cave': CellularAutomaton,
+}
+
+
+def generate_random_level(size: int, wall_density: float, seed: int, disposition: str = 'square') -> GenericLevel:
+    """
+    Generates a level of `size * size` cells,
+    in which each cell has a `wall_density` probability of being a wall.
+    The starting point is placed in the upper-left corner,
+    and the arrival point in the lower-right one.
+    Such levels are not guaranteed to have a solution.
+    """
+    rng = np.random.default_rng(seed)
+    level = GenericLevel.create_new_level(name=f'Benchmark {size}x{size} ({wall_density})',
+                                          author='LevelTwoBench',
+                                          size=(size, size),
+                                          disposition=disposition)
+    level.content[rng.random((size, size)) < wall_density] = Wall().identifier
+    level.content[~get_cells_mask(disposition, (size, size))] = 0
+    level.content[0, 0] = StartingPoint().identifier
+    level.content[size - 1, size - 1] = ArrivalPoint().identifier
+    level.set_objects([obj() for obj in all_objects])
+    return level
+
+
+def generate_level(generator: str, size: int, wall_density: float, seed: int,
+                   disposition: str = 'square') -> GenericLevel:
+    """
+    Generates a level with the generator passed.
+    The wall density is only used by 'random' levels.
+    """
+    generator_class = generators[generator]
+    if generator_class is None:
+        return generate_random_level(size, wall_density, seed, disposition)
+    return generator_class((size, size), disposition, seed).generate()
+
+
+def benchmark(algorithm_class: Type[MazeSolvingAlgorithm], level: GenericLevel,
+              repeat: int = 1, measure_memory: bool = True, max_steps: Optional[int] = None) -> dict:
+    """
+    Runs the algorithm on the level `repeat` times, and returns its statistics.
+    The wall time is the best of all runs.
+    As tracing memory allocations slows the execution down,
+    the peak memory is measured during an additional run.
+    """
+    runner = HeadlessRunner(level, max_steps=max_steps)
+
+    wall_time = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = runner.run(algorithm_class)
+        wall_time = min(wall_time, time.perf_counter() - start)
+
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        runner.run(algorithm_class)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'algorithm': algorithm_class.__name__,
+        'solved': result.solved,
+        'wall_time': wall_time,
+        'steps': result.steps_number,
+        'steps_per_second': result.steps_number / wall_time if wall_time > 0 else None,
+        'expanded_nodes': result.algorithm.expanded_nodes,
+        'path_length': len(result.path),
+        'peak_memory': peak_memory,
+    }
+
+
+def run_benchmarks(algorithms: List[str], sizes: List[int], densities: List[float], seed: int = 0,
+                   repeat: int = 1, measure_memory: bool = True, max_steps: Optional[int] = None,
+                   generator: str = 'random', disposition: str = 'square') -> dict:
+    if generator != 'random':
+        # The density is not used by the other generators
+        densities = [None]
+    results = []
+    for size in sizes:
+        for density in densities:
+            level = generate_level(generator, size, density, seed, disposition)
+            for name in algorithms:
+                if name not in solvers[disposition]:
+                    print(f'{name} is not available on {disposition} levels, skipped', file=sys.stderr)
+                    continue
+                stats = benchmark(solvers[disposition][name], level, repeat=repeat,
+                                  measure_memory=measure_memory, max_steps=max_steps)
+                stats.update({'generator': generator, 'disposition': disposition,
+                              'size': size, 'wall_density': density, 'seed': seed})
+                results.append(stats)
+                print(f"{name:>16} | {generator:>11} | {size:>5} | {str(density):>4} | "
+                      f"{'solved' if stats['solved'] else 'failed':>6} | "
+                      f"{stats['wall_time']:>9.4f}s | {stats['expanded_nodes']:>9} nodes | "
+                      f"{stats['path_length']:>7} path",
+                      file=sys.stderr)
+    return {
+        'date': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks the maze solving algorithms.')
+    parser.add_argument('--algorithms', nargs='+', choices=solvers_names, default=None,
+                        help='Default is all the algorithms available for the disposition.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[25, 50, 100])
+    parser.add_argument('--densities', nargs='+', type=float, default=[0.1, 0.25],
+                        help="Wall densities of the 'random' levels.")
+    parser.add_argument('--generator', choices=list(generators), default='random')
+    parser.add_argument('--disposition', choices=list(solvers), default='square')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per benchmark, the best time is kept.')
+    parser.add_argument('--max-steps', type=int, default=None)
+    parser.add_argument('--no-memory', action='store_true', help='Do not measure the peak memory.')
+    parser.add_argument('--output', default=None, help='JSON file to write the results to (default: stdout).')
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithms
+    if algorithms is None:
+        algorithms = list(solvers[args.disposition])
+    report = run_benchmarks(algorithms, args.sizes, args.densities, seed=args.seed, repeat=args.repeat,
+                            measure_memory=not args.no_memory, max_steps=args.max_steps,
+                            generator=args.generator, disposition=args.disposition)
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,28 @@ This files contains common variables used across the project.
 
 """
 
+from typing import Dict, Optional, Union
+
 
 class Config:
 
     project_name: str = "LevelTwo"
+
+    # How the content of new levels is stored in the database.
+    # None stores one row per cell, 'raw' and 'zlib' store the content
+    # as a single binary blob (see `LevelDBO`).
+    level_content_encoding: Optional[str] = None
+
+    # Maximum number of levels kept in memory by the database (see `LevelCache`).
+    level_cache_capacity: int = 16
+
+    # Pragmas applied to each new connection to the SQLite database.
+    # The write-ahead log lets readers (e.g. benchmark workers) work while another process writes,
+    # and with it, `synchronous=NORMAL` is safe and avoids syncing the disk on each transaction.
+    # A negative cache size is in KiB.
+    sqlite_pragmas: Dict[str, Union[str, int]] = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+    }
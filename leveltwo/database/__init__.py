@@ -1,4 +1,4 @@
-from .database import Database
+from .database import Database, ReadOnlyDatabase
 from .models import Base, ObjectDBO, LevelDBO, LevelContentDBO, TestDBO, TestContentDBO
 
 from .init.insert_all import insert_all
@@ -0,0 +1,66 @@
+"""
+Implements an in-memory cache of the levels loaded from the database.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from ..level import GenericLevel
+
+
+class LevelCache:
+
+    """
+    Least recently used cache of levels, keyed by level identifier.
+    An entry is only valid as long as the version of the level in the database
+    (see `LevelDBO.version`) is the one it had when it was cached.
+
+    Levels are copied both when cached and when returned,
+    so that modifying a level does not alter the cache.
+
+    Parameters
+    ----------
+
+    capacity: int
+        Maximum number of levels held. `0` disables the cache.
+
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._levels: 'OrderedDict[int, Tuple[int, GenericLevel]]' = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def get(self, level_id: int, version: int) -> Optional[GenericLevel]:
+        """
+        Returns a copy of the cached level, None if it is not cached or outdated.
+        """
+        entry = self._levels.get(level_id)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return
+        self.hits += 1
+        self._levels.move_to_end(level_id)
+        return entry[1].copy()
+
+    def put(self, level: GenericLevel, version: int) -> None:
+        """
+        Caches a copy of the level, whose content is the one of `version`, or a later one.
+        """
+        if self.capacity <= 0:
+            return
+        self._levels[level.identifier] = (version, level.copy())
+        self._levels.move_to_end(level.identifier)
+        while len(self._levels) > self.capacity:
+            # Remove the least recently used level
+            self._levels.popitem(last=False)
+
+    def invalidate(self, level_id: int) -> None:
+        self._levels.pop(level_id, None)
+
+    def clear(self) -> None:
+        self._levels.clear()
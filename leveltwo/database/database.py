@@ -5,18 +5,32 @@ import leveltwo
 
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from contextlib import contextmanager
+from typing import List, Optional
 
-from sqlalchemy import create_engine, exists
-from sqlalchemy.orm import sessionmaker
+import numpy as np
+
+from sqlalchemy import create_engine, event, exists, and_, bindparam, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker, Session
 
 from .init import insert_objects, insert_levels, insert_levels_content
 from .models import Base, ObjectDBO, LevelDBO, LevelContentDBO, TestDBO, TestContentDBO
+from .cache import LevelCache
+from .migrations import migrate_schema
 
+from ..config import Config
+from ..utils import array_to_bytes, bytes_to_array, string_to_list
 from ..object import GenericObject
 from ..test import Test, TestContent
-from ..level import GenericLevel, GenericLevelContent
+from ..level import GenericLevel, GenericLevelContent, LevelSummary
+
 
+# Compression used by each level content encoding (see `LevelDBO.content_encoding`).
+content_encodings_compression = {
+    'raw': None,
+    'zlib': 'zlib',
+}
 
 class Database:
 
@@ -28,6 +42,12 @@ class Database:
     _instance = None
     engine = None
     session = None
+    level_cache = None
+    # Identifier of the process the engine was created in.
+    pid = None
+    # Session of the transaction in progress, see `init_session()`.
+    _active_session = None
+    read_only: bool = False
 
     def __new__(cls, init: bool = True):
         """
@@ -40,11 +60,8 @@ class Database:
 
             # Initialization, only called during first instantiation
             cls._instance = super(Database, cls).__new__(cls)
-            path = Path(os.path.abspath(leveltwo.__file__)).parent
-            db_path = os.path.join(path, "LevelTwo.db")
-            cls._instance.engine = create_engine(f'sqlite:///{db_path}')
-            cls._instance.session = sessionmaker(bind=cls._instance.engine)
-            Base.metadata.bind = cls._instance.engine
+            cls._instance.connect()
+            cls._instance.level_cache = LevelCache(Config.level_cache_capacity)
             if init:
                 cls._instance.init_db()
 
@@ -52,12 +69,46 @@ class Database:
 
     # General operations section
 
+    @staticmethod
+    def get_path() -> str:
+        path = Path(os.path.abspath(leveltwo.__file__)).parent
+        return os.path.join(path, "LevelTwo.db")
+
+    def get_url(self) -> str:
+        return f'sqlite:///{self.get_path()}'
+
+    def connect(self) -> None:
+        """
+        Creates the engine, bound to the current process.
+        """
+        if self.engine is not None:
+            # Drop the connections inherited from the parent process, without closing them,
+            # as the parent still uses them.
+            self.engine.dispose(close=False)
+        self.engine = create_engine(self.get_url())
+        event.listen(self.engine, 'connect', self.set_pragmas)
+        self.session = sessionmaker(bind=self.engine)
+        self.pid = os.getpid()
+        Base.metadata.bind = self.engine
+
+    def set_pragmas(self, dbapi_connection, connection_record) -> None:
+        """
+        Applies the pragmas of `Config.sqlite_pragmas` to a new connection.
+        """
+        cursor = dbapi_connection.cursor()
+        for pragma, value in Config.sqlite_pragmas.items():
+            if self.read_only and pragma == 'journal_mode':
+                # Changing the journal mode requires writing to the database
+                continue
+            cursor.execute(f'PRAGMA {pragma}={value}')
+        cursor.close()
+
     def init_db(self):
         logging.info('Initiating database')
 
         try:
             count = self.get_tables_counts()
-        except sqlite3.OperationalError:
+        except (sqlite3.OperationalError, OperationalError):
             # If we could not query the tables,
             # that means we must create the tables and insert the default values in.
             delete_tables = False
@@ -67,6 +118,8 @@ class Database:
             # If we could query the tables, that means we don't have to delete nor create them.
             delete_tables = False
             create_tables = False
+            # Upgrade the tables if they were created with older models
+            migrate_schema(self)
             if any([v == 0 for v in count]):
                 # If any of the tables are empty, we'll insert the default values
                 insert_values = True
@@ -91,8 +144,29 @@ class Database:
         Base.metadata.drop_all(bind=self.engine)
         logging.info('Deleted all tables')
 
-    def init_session(self):
-        return self.session.begin()
+    @contextmanager
+    def init_session(self) -> Session:
+        """
+        Opens a transaction, committed when the block exits, and returns its session.
+        Sessions opened while a transaction is in progress reuse it:
+        wrapping calls to several methods in an `init_session()` block
+        makes them a single unit of work, committed (or rolled back) at once.
+        """
+        if self._active_session is not None:
+            yield self._active_session
+            return
+
+        if self.pid != os.getpid():
+            # We are in a process forked from the one which created the engine
+            # (e.g. a worker of `leveltwo.batch`): SQLite connections cannot be
+            # shared across processes, so this one gets its own engine.
+            self.connect()
+        with self.session.begin() as session:
+            self._active_session = session
+            try:
+                yield session
+            finally:
+                self._active_session = None
 
     def get_tables_counts(self) -> dict:
         with self.init_session() as session:
@@ -132,6 +206,38 @@ class Database:
             b = session.query(exists().where(LevelDBO.id == level_id)).scalar()
         return b
 
+    def get_level_summaries(self, levels_ids: Optional[List[int]] = None) -> List[LevelSummary]:
+        """
+        Returns the metadata of the levels, along with the number of tests ran on each,
+        in a single query, without loading their content.
+        By default, returns all the levels.
+        """
+        with self.init_session() as session:
+            q = session.query(
+                LevelDBO.id,
+                LevelDBO.name,
+                LevelDBO.author,
+                LevelDBO.disposition,
+                LevelDBO.shape,
+                LevelDBO.creation_date,
+                LevelDBO.last_modification_date,
+                func.count(TestDBO.id),
+            ).outerjoin(TestDBO, TestDBO.level_id == LevelDBO.id)
+            if levels_ids is not None:
+                q = q.filter(LevelDBO.id.in_(levels_ids))
+            q = q.group_by(LevelDBO.id).order_by(LevelDBO.id).all()
+        return [
+            LevelSummary(identifier, name, author, disposition, tuple(int(v) for v in string_to_list(shape)),
+                         creation_date, last_modification_date, tests_count)
+            for identifier, name, author, disposition, shape, creation_date, last_modification_date, tests_count in q
+        ]
+
+    def get_level_summary(self, level_id: int) -> LevelSummary:
+        summaries = self.get_level_summaries([level_id])
+        if len(summaries) != 1:
+            raise ValueError(f'Level {level_id} does not exist')
+        return summaries[0]
+
     def get_all_levels(self) -> List[GenericLevel]:
         with self.init_session() as session:
             q = session.query(LevelDBO.id).all()
@@ -141,58 +247,158 @@ class Database:
                 levels.append(self.construct_level(level_id))
         return levels
 
-    def update_level_content(self, level: GenericLevel) -> None:
+    @staticmethod
+    def get_level_content_mappings(level_id: int, content: np.array, cells: np.array,
+                                   prefix: str = '') -> List[dict]:
+        """
+        Returns, for each cell passed (an array of shape `(n, 2)`),
+        a dictionary describing its row in the `levels_content` table,
+        to be used with bulk operations.
+        Keys are prefixed with `prefix`.
+        """
+        cells_x = cells[:, 0]
+        cells_y = cells[:, 1]
+        values = content[cells_x, cells_y]
+        return [
+            {f'{prefix}level_id': level_id, f'{prefix}pos_x': x, f'{prefix}pos_y': y, f'{prefix}value': value}
+            for x, y, value in zip(cells_x.tolist(), cells_y.tolist(), values.tolist())
+        ]
 
+    def update_level_content(self, level: GenericLevel) -> None:
+        """
+        Stores the level, in a single transaction.
+        """
         level_id = level.identifier
-        if level_id is None or not self.level_exists(level_id):
-            # If the level does not exist already, we'll add it
-            self.add_new_level(level)
-        else:
+        if level_id is not None:
+            self.level_cache.invalidate(level_id)
+        with self.init_session() as session:
+            if level_id is None or not self.level_exists(level_id):
+                # If the level does not exist already, we'll add it
+                self.add_new_level(level)
+                return
             # If the level already exists in the database
-            # First, update its content
-            s_x, s_y = level.content.shape
-            with self.init_session() as session:
-                for x in range(s_x):
-                    for y in range(s_y):
-                        cell = session.query(LevelContentDBO).filter_by(level_id=level_id,
-                                                                        pos_x=x,
-                                                                        pos_y=y).one()
-                        cell.value = int(level.content[x, y])
-            # Next, update the modification date in the levels table
-            with self.init_session() as session:
-                level_dbo = session.query(LevelDBO).filter_by(id=level_id).one()
-                level_dbo.last_modification_date = datetime.now()
-            # Finally, remove tests that ran on the older level version
-            with self.init_session() as session:
-                q = session.query(TestDBO).filter_by(level_id=level_id).all()
-                for row in q:
-                    # Delete the test
-                    session.delete(row)
-                    # Delete the content of the test
-                    session.query(TestContentDBO).filter_by(test_id=row.id).delete()
-
-    def add_new_level(self, level: GenericLevel) -> None:
+            # First, update its content.
+            # If stored as one row per cell, only the cells that changed
+            # since the level was loaded are written.
+            modified_cells = level.get_modified_cells()
+            if len(modified_cells) == 0:
+                return
+            level_dbo = session.query(LevelDBO).filter_by(id=level_id).one()
+            encoding = level_dbo.content_encoding
+            if encoding is None:
+                self._update_level_content_cells(level, modified_cells)
+            else:
+                # The whole blob is rewritten
+                level_dbo.content_blob = array_to_bytes(level.content, content_encodings_compression[encoding])
+            # Next, update the modification date and the version in the levels table
+            level_dbo.last_modification_date = datetime.now()
+            self._increment_level_version(level_dbo)
+            # Finally, remove tests that ran on the older level version, along with their content
+            tests_ids = session.query(TestDBO.id).filter_by(level_id=level_id)
+            session.query(TestContentDBO).filter(TestContentDBO.test_id.in_(tests_ids.scalar_subquery())) \
+                .delete(synchronize_session=False)
+            session.query(TestDBO).filter_by(level_id=level_id).delete(synchronize_session=False)
+        level.mark_as_stored()
+
+    def _update_level_content_cells(self, level: GenericLevel, cells: np.array) -> None:
+        """
+        Updates the rows of the `levels_content` table corresponding to `cells`,
+        in a single statement executed for all of them.
+        """
+        table = LevelContentDBO.__table__
+        statement = table.update().where(
+            and_(
+                table.c.level_id == bindparam('b_level_id'),
+                table.c.pos_x == bindparam('b_pos_x'),
+                table.c.pos_y == bindparam('b_pos_y'),
+            )
+        ).values(value=bindparam('b_value'))
+        mappings = self.get_level_content_mappings(level.identifier, level.content, cells, prefix='b_')
+        with self.init_session() as session:
+            session.execute(statement, mappings)
+
+    def add_new_level(self, level: GenericLevel, encoding: Optional[str] = None) -> None:
         """
         Takes a new generic level, and adds it to the database.
+        Its content is stored according to `encoding` (see `LevelDBO.content_encoding`),
+        by default `Config.level_content_encoding`, read at the time of the call.
         """
-        # First, add the level
+        if encoding is None:
+            encoding = Config.level_content_encoding
         with self.init_session() as session:
+            # First, add the level
             level_dbo = level.to_dbo()
-            # Using arbitrary format ? Ouch...
+            if encoding is not None:
+                level_dbo.content_encoding = encoding
+                level_dbo.content_blob = array_to_bytes(level.content, content_encodings_compression[encoding])
             session.add(level_dbo)
-            # Refresh the session to get the inserted level id
+            # Flush the session to get the inserted level id
             session.flush()
-            session.refresh(level_dbo)
             level_id = level_dbo.id
-        # Next, add the level's content
-        s_x, s_y = level.content.shape
+            if encoding is None:
+                # Next, add the level's content, all cells at once
+                all_cells = np.argwhere(np.ones(level.content.shape, dtype='bool'))
+                session.bulk_insert_mappings(
+                    LevelContentDBO,
+                    self.get_level_content_mappings(level_id, level.content, all_cells)
+                )
+        level.identifier = level_id
+        level.mark_as_stored()
+
+    def get_level_content_encoding(self, level_id: int) -> Optional[str]:
         with self.init_session() as session:
-            for x in range(s_x):
-                for y in range(s_y):
-                    cell = LevelContentDBO(level_id, x, y, int(level.content[x, y]))
-                    session.add(cell)
+            encoding, = session.query(LevelDBO.content_encoding).filter_by(id=level_id).one()
+        return encoding
+
+    def convert_level_content(self, level_id: int, encoding: Optional[str]) -> None:
+        """
+        Changes the way the content of a level is stored (see `LevelDBO.content_encoding`).
+        """
+        level = self.construct_level(level_id)
+        with self.init_session() as session:
+            level_dbo = session.query(LevelDBO).filter_by(id=level_id).one()
+            if encoding is None:
+                if level_dbo.content_encoding is not None:
+                    all_cells = np.argwhere(np.ones(level.content.shape, dtype='bool'))
+                    session.bulk_insert_mappings(
+                        LevelContentDBO,
+                        self.get_level_content_mappings(level_id, level.content, all_cells)
+                    )
+                level_dbo.content_blob = None
+            else:
+                level_dbo.content_blob = array_to_bytes(level.content, content_encodings_compression[encoding])
+                session.query(LevelContentDBO).filter_by(level_id=level_id).delete()
+            level_dbo.content_encoding = encoding
+            self._increment_level_version(level_dbo)
+        self.level_cache.invalidate(level_id)
+        logging.info(f'Converted content of level {level_id} to encoding {encoding!r}')
+
+    @staticmethod
+    def _increment_level_version(level_dbo: LevelDBO) -> None:
+        """
+        Increments the version of the level (see `LevelDBO.version`), within the SQL statement,
+        so that concurrent updates from other processes are not lost.
+        """
+        level_dbo.version = func.coalesce(LevelDBO.version, 0) + 1
 
     def construct_level(self, level_id: int) -> GenericLevel:
+        """
+        Returns the level, from the cache if it was not modified since it was cached.
+        """
+        with self.init_session() as session:
+            version, = session.query(func.coalesce(LevelDBO.version, 0)).filter(LevelDBO.id == level_id).one()
+        level = self.level_cache.get(level_id, version)
+        if level is None:
+            # If the level is modified meanwhile, the content read is newer than `version`,
+            # and it will just be read again next time.
+            level = self._load_level(level_id)
+            self.level_cache.put(level, version)
+        return level
+
+    def _load_level(self, level_id: int) -> GenericLevel:
+        """
+        Reads the level and its content from the database.
+        """
 
         def get_content(identifier: int) -> List[GenericLevelContent]:
             with self.init_session() as s:
@@ -204,7 +410,17 @@ class Database:
             return content
 
         with self.init_session() as session:
-            level = GenericLevel.from_dbo(session.query(LevelDBO).filter_by(id=level_id).one())
+            level_dbo = session.query(LevelDBO).filter_by(id=level_id).one()
+            level = GenericLevel.from_dbo(level_dbo)
+            encoding = level_dbo.content_encoding
+            blob = level_dbo.content_blob
+
+        if encoding is not None:
+            # The content is stored as a single blob
+            compression = content_encodings_compression[encoding]
+            level.content = bytes_to_array(blob, level.content.shape, compression)
+            level.mark_as_stored()
+            return level
 
         mapping = get_content(level.identifier)
         # For each cell stored in the database, paste its content in the array.
@@ -212,6 +428,7 @@ class Database:
         # their value to `0`, as we create by default an array of zeros.
         for cell in mapping:
             level.content[cell.x, cell.y] = cell.value
+        level.mark_as_stored()
         return level
 
     # Tests section
@@ -230,35 +447,57 @@ class Database:
         with self.init_session() as session:
             test = Test.from_dbo(session.query(TestDBO).filter_by(id=test_id).one())
 
-        mapping = get_content(test.identifier)
-        for step in mapping:
-            test.steps[step.step] = (step.x, step.y)
+        if isinstance(test.steps, list):
+            # Steps stored one row per step, in older databases
+            mapping = get_content(test.identifier)
+            for step in mapping:
+                test.steps[step.step] = (step.x, step.y)
         return test
 
     def get_tests_by_level_id(self, level_id: int) -> List[Test]:
+        """
+        Returns all the tests ran on a level, loaded with a single query.
+        """
         test_list = []
         with self.init_session() as session:
-            q = session.query(TestDBO.id).filter_by(level_id=level_id).all()
-            for content in q:
-                for test_id in content:
-                    test_list.append(self.construct_test(test_id))
+            q = session.query(TestDBO).filter_by(level_id=level_id).order_by(TestDBO.id).all()
+            for row in q:
+                if row.steps_blob is not None:
+                    test_list.append(Test.from_dbo(row))
+                else:
+                    test_list.append(self.construct_test(row.id))
         return test_list
 
     def store_test(self, test: Test) -> None:
         """
         Takes information about a test, and stores it into the database.
+        The steps are stored packed in the test row.
         """
-        # First, add the test
         with self.init_session() as session:
-            test_dbo = test.to_dbo()
-            session.add(test_dbo)
-            # Refresh the session to get the inserted test id
-            session.flush()
-            session.refresh(test_dbo)
-            test_id = test_dbo.id
-        # Next, add the content of the test
+            session.add(test.to_dbo())
+
+    def store_tests(self, tests: List[Test]) -> None:
+        """
+        Stores several tests at once, in a single transaction.
+        """
         with self.init_session() as session:
-            for step_index, step_pos in enumerate(test.steps):
-                pos_x, pos_y = step_pos
-                step = TestContentDBO(test_id, step_index, int(pos_x), int(pos_y))
-                session.add(step)
+            session.add_all([test.to_dbo() for test in tests])
+
+
+class ReadOnlyDatabase(Database):
+
+    """
+    Read-only connection to the database, for processes which only read,
+    and can thus work while another one writes (the database uses a write-ahead log).
+    It is a singleton of its own, and never initializes the database:
+    it must have been created by `Database` beforehand.
+    """
+
+    _instance = None
+    read_only = True
+
+    def __new__(cls):
+        return super().__new__(cls, init=False)
+
+    def get_url(self) -> str:
+        return f'sqlite:///file:{self.get_path()}?mode=ro&uri=true'
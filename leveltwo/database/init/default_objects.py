@@ -61,7 +61,9 @@ class Mud(GenericObject):
         traversable = True
         min_instances = 5
         max_instances = 20
-        super().__init__(5, name, effect, traversable, min_instances, max_instances)
+        # One step to move, and another one stunned.
+        cost = 2
+        super().__init__(5, name, effect, traversable, min_instances, max_instances, cost)
 
 
 class Trap(GenericObject):
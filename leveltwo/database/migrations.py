@@ -0,0 +1,80 @@
+"""
+Upgrades existing databases to the current models,
+and converts the way levels are stored.
+"""
+
+import logging
+
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from .models import Base, LevelDBO
+
+
+def migrate_schema(db) -> None:
+    """
+    Adds to the existing tables the columns and indexes declared in the models but missing in the database.
+    Tables that do not exist are left to `Database.create_tables()`.
+    """
+    inspector = inspect(db.engine)
+    existing_tables = inspector.get_table_names()
+    with db.engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                logging.info(f'Added column {column.name!r} to table {table.name!r}')
+
+    create_missing_indexes(db)
+
+
+def create_missing_indexes(db) -> None:
+    """
+    Creates the indexes declared in the models but missing in the database.
+    """
+    inspector = inspect(db.engine)
+    existing_tables = inspector.get_table_names()
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            try:
+                with db.engine.begin() as connection:
+                    index.create(bind=connection)
+            except IntegrityError:
+                # Duplicated rows prevent creating a unique index
+                logging.warning(f'Could not create unique index {index.name!r} on table {table.name!r}, '
+                                f'as it holds duplicated rows')
+            else:
+                logging.info(f'Created index {index.name!r} on table {table.name!r}')
+
+
+def convert_levels_content(db, encoding: Optional[str]) -> None:
+    """
+    Converts the content of all the levels in the database to `encoding`
+    (see `LevelDBO.content_encoding`).
+    """
+    with db.init_session() as session:
+        levels_ids = [level_id for level_id, in session.query(LevelDBO.id).all()]
+    for level_id in levels_ids:
+        db.convert_level_content(level_id, encoding)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from .database import Database
+
+    # Usage: python -m leveltwo.database.migrations [raw|zlib|cells]
+    new_encoding = sys.argv[1] if len(sys.argv) > 1 else 'zlib'
+    convert_levels_content(Database(), None if new_encoding == 'cells' else new_encoding)
@@ -3,8 +3,9 @@ Defines the database models.
 """
 
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, Date, Integer, String, Boolean, ForeignKey
+from sqlalchemy import Column, Date, Integer, String, Boolean, ForeignKey, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -21,13 +22,18 @@ class ObjectDBO(Base):
     traversable = Column(Boolean)
     min_instances = Column(Integer)
     max_instances = Column(Integer)
+    # Number of steps it takes to walk on the object.
+    # Objects stored before this column was added have none, their cost then depends on their effect.
+    cost = Column(Integer, nullable=True)
 
-    def __init__(self, name: str, effect: int, traversable: bool, min_instances: int, max_instances: int):
+    def __init__(self, name: str, effect: int, traversable: bool, min_instances: int, max_instances: int,
+                 cost: Optional[int] = None):
         self.name = name
         self.effect = effect
         self.traversable = traversable
         self.min_instances = min_instances
         self.max_instances = max_instances
+        self.cost = cost
 
 
 class LevelDBO(Base):
@@ -40,6 +46,16 @@ class LevelDBO(Base):
     shape = Column(String(8))
     creation_date = Column(Date, default=datetime.utcnow())
     last_modification_date = Column(Date)
+    # How the content of the level is stored:
+    # - None: one row per cell, in the `levels_content` table
+    # - 'raw': in `content_blob`, as int16 bytes
+    # - 'zlib': in `content_blob`, as int16 bytes compressed with zlib
+    content_encoding = Column(String(8), nullable=True)
+    content_blob = Column(LargeBinary, nullable=True)
+    # Incremented each time the content changes, so that cached levels can be checked.
+    # The modification date cannot be used, as it only holds the day.
+    # Levels stored before this column was added have none, which counts as `0`.
+    version = Column(Integer, default=0, nullable=True)
 
     def __init__(self, name: str, author: str, disposition: str, shape: str,
                  creation_date: datetime, last_modification_date: datetime):
@@ -53,6 +69,10 @@ class LevelDBO(Base):
 
 class LevelContentDBO(Base):
     __tablename__ = "levels_content"
+    __table_args__ = (
+        # Cells are looked up by position, and a level holds one row per cell.
+        Index('ix_levels_content_position', 'level_id', 'pos_x', 'pos_y', unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     level_id = Column(ForeignKey('levels.id', ondelete='CASCADE'))
@@ -71,21 +91,29 @@ class TestDBO(Base):
     __tablename__ = "tests"
 
     id = Column(Integer, primary_key=True)
-    level_id = Column(ForeignKey('levels.id', ondelete='CASCADE'))
+    level_id = Column(ForeignKey('levels.id', ondelete='CASCADE'), index=True)
     algorithm = Column(String(32))
     steps_number = Column(Integer)
     content = relationship("TestContentDBO", back_populates="test", passive_deletes=True)
     run_date = Column(Date, default=datetime.utcnow())
+    # Positions of the character at each step, as int16 `(x, y)` pairs.
+    # Tests stored before this column was added have their steps in `tests_content` instead.
+    steps_blob = Column(LargeBinary, nullable=True)
 
-    def __init__(self, level_id: int, algorithm: str, steps_number: int, run_date: datetime):
+    def __init__(self, level_id: int, algorithm: str, steps_number: int, run_date: datetime,
+                 steps_blob: Optional[bytes] = None):
         self.level_id = level_id
         self.algorithm = algorithm
         self.steps_number = steps_number
         self.run_date = run_date
+        self.steps_blob = steps_blob
 
 
 class TestContentDBO(Base):
     __tablename__ = "tests_content"
+    __table_args__ = (
+        Index('ix_tests_content_step', 'test_id', 'step'),
+    )
 
     id = Column(Integer, primary_key=True)
     test_id = Column(ForeignKey('tests.id', ondelete='CASCADE'), nullable=False)
@@ -11,11 +11,13 @@ from .exceptions import InvalidLevelType
 
 from .maze.square import MazeEditableSquare
 from .maze.square import MazePlayableSquare
-from .algorithm.square import TremauxSquare, ManualSquare, AstarSquare
+from .algorithm.square import TremauxSquare, ManualSquare, AstarSquare, WeightedAstarSquare, DistanceFieldSquare, \
+    JpsSquare
 
 from .maze.hexagonal import MazeEditableHexagonal
 from .maze.hexagonal import MazePlayableHexagonal
-from .algorithm.hexagonal import ManualHexagonal
+from .algorithm.hexagonal import ManualHexagonal, TremauxHexagonal, AstarHexagonal, WeightedAstarHexagonal, \
+    DistanceFieldHexagonal
 
 from typing import Tuple
 
@@ -74,7 +76,7 @@ class LevelEditor(Display):
                             maxchar=16)
 
         # Level selector
-        all_levels = self.db.get_all_levels()
+        all_levels = self.db.get_level_summaries()
         menu.add.selector('Level selected: ',
                           [(level.name, level.identifier) for level in all_levels],
                           onchange=on_level_change)
@@ -158,7 +160,7 @@ class Play(Display):
         menu = pygame_menu.Menu(Config.project_name, *self.screen_size, theme=self.theme)
 
         # Level selector
-        all_levels = self.db.get_all_levels()
+        all_levels = self.db.get_level_summaries()
         menu.add.selector('Level selected: ',
                           [(level.name, level.identifier) for level in all_levels],
                           onchange=on_level_change)
@@ -183,18 +185,25 @@ class Play(Display):
         # Algorithm selector
 
         # Construct available algorithm depending on the level type
-        level = self.db.construct_level(self.level_selected)
+        level = self.db.get_level_summary(self.level_selected)
         if level.disposition == 'square':
             default_algo = ManualSquare
             algorithms = [
                 ('Manual', ManualSquare),
                 ('Trémaux', TremauxSquare),
-                ('Astar', AstarSquare)
+                ('Astar', AstarSquare),
+                ('Weighted Astar', WeightedAstarSquare),
+                ('JPS', JpsSquare),
+                ('Distance field', DistanceFieldSquare)
             ]
         elif level.disposition == 'hexagonal':
             default_algo = ManualHexagonal
             algorithms = [
-                ('Manual', ManualHexagonal)
+                ('Manual', ManualHexagonal),
+                ('Trémaux', TremauxHexagonal),
+                ('Astar', AstarHexagonal),
+                ('Weighted Astar', WeightedAstarHexagonal),
+                ('Distance field', DistanceFieldHexagonal)
             ]
         else:
             raise InvalidLevelType(level.disposition)
@@ -0,0 +1,7 @@
+from .base import MazeGenerator, PerfectMazeGenerator
+
+from .backtracker import RecursiveBacktracker
+from .kruskal import Kruskal
+from .wilson import Wilson
+from .binary_tree import BinaryTree
+from .cellular import CellularAutomaton
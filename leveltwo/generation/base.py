@@ -0,0 +1,195 @@
+import random
+
+import numpy as np
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ..level import GenericLevel
+from ..topology import get_neighbour_offsets, get_cells_mask
+from ..database.init.default_objects import all_objects, Empty, StartingPoint, ArrivalPoint, Wall, Mud, Trap
+
+
+class MazeGenerator:
+
+    """
+    Generates levels procedurally.
+    Subclasses implement `generate_content()`, which lays out the empty cells and the walls,
+    the other objects being placed afterwards by `place_objects()`.
+
+    Parameters
+    ----------
+
+    size: Tuple[int, int]
+        Shape of the level to generate.
+
+    disposition: str
+        Either 'square' or 'hexagonal'.
+
+    seed: int, optional
+        Seed of the random generator, for reproducible levels.
+
+    """
+
+    name: str
+
+    def __init__(self, size: Tuple[int, int], disposition: str = 'square', seed: Optional[int] = None):
+        self.size = size
+        self.disposition = disposition
+        self.offsets = get_neighbour_offsets(disposition)
+        self.cells_mask = get_cells_mask(disposition, size)
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        # Python's generator is faster when drawing numbers one at a time, in loops.
+        self.random = random.Random(int(self.rng.integers(2 ** 32)))
+
+    def generate(self, name: Optional[str] = None, author: str = 'LevelTwoGenerator') -> GenericLevel:
+        content = self.generate_content()
+        self.place_objects(content)
+        if name is None:
+            s_x, s_y = self.size
+            name = f'{self.name} {s_x}x{s_y} ({self.seed})'
+        now = datetime.utcnow()
+        level = GenericLevel(None, name, author, self.disposition, content, now, now)
+        level.set_objects([obj() for obj in all_objects])
+        return level
+
+    def generate_content(self) -> np.array:
+        """
+        Returns the content of the level, made of empty cells and walls
+        (and invalid cells, for hexagonal levels).
+        All the empty cells must be connected.
+        """
+        raise NotImplementedError()
+
+    def count_open_neighbours(self, is_open: np.array) -> np.array:
+        """
+        Returns, for each cell, how many of its adjacent cells are open.
+        """
+        s_x, s_y = is_open.shape
+        counts = np.zeros(is_open.shape, dtype='int8')
+        for offset_x, offset_y in self.offsets:
+            counts[max(offset_x, 0):s_x + min(offset_x, 0), max(offset_y, 0):s_y + min(offset_y, 0)] += \
+                is_open[max(-offset_x, 0):s_x + min(-offset_x, 0), max(-offset_y, 0):s_y + min(-offset_y, 0)]
+        return counts
+
+    def place_objects(self, content: np.array) -> None:
+        """
+        Places, on the empty cells, the starting point, the arrival point,
+        and a number of mud and trap cells within their objects' limits.
+        Traps are only placed in dead-ends, so that they never block the way.
+        Empty cells and walls are structural: their number depends on the size of the level,
+        and can exceed their objects' limits on large levels.
+        """
+        empty = Empty().identifier
+        is_open = content == empty
+        open_cells = np.flatnonzero(is_open)
+        if len(open_cells) < 2:
+            raise ValueError('Not enough empty cells to place the starting and arrival points')
+
+        # Dead-ends, computed before anything else is placed.
+        dead_ends = np.flatnonzero(is_open & (self.count_open_neighbours(is_open) == 1))
+
+        flat_content = content.reshape(-1)  # View on the content
+        start, arrival = self.rng.choice(open_cells, size=2, replace=False)
+        flat_content[start] = StartingPoint().identifier
+        flat_content[arrival] = ArrivalPoint().identifier
+
+        for obj, candidates in ((Trap(), dead_ends), (Mud(), open_cells)):
+            candidates = candidates[flat_content[candidates] == empty]
+            number = int(self.rng.integers(obj.min_instances, obj.max_instances + 1))
+            number = min(number, len(candidates))
+            flat_content[self.rng.choice(candidates, size=number, replace=False)] = obj.identifier
+
+    def get_empty_content(self) -> np.array:
+        """
+        Returns a content filled with walls, cells that do not exist being set to `0`.
+        """
+        content = np.full(self.size, Wall().identifier, dtype='int16')
+        content[~self.cells_mask] = 0
+        return content
+
+
+class PerfectMazeGenerator(MazeGenerator):
+
+    """
+    Generates perfect mazes: there is exactly one way between any two empty cells.
+
+    Cells with even coordinates are nodes. Two nodes `a` and `a + 2 * offset` are linked
+    by the cell in between, `a + offset`, which is either empty or a wall.
+    This works for both square and hexagonal dispositions,
+    and subclasses only have to choose which links form a spanning tree of the nodes
+    (see `select_edges()`).
+
+    On hexagonal levels, the cells linking a node to two neighbours 60° apart are adjacent,
+    which would open loops. So one node out of three is left out (see `get_graph()`):
+    the others form a honeycomb, in which the links of a node are 120° apart,
+    and no two link cells touch.
+    """
+
+    def get_graph(self) -> Tuple[np.array, np.array, np.array, np.array]:
+        """
+        Returns the nodes, as a boolean array of the node grid,
+        along with the edges between them: two arrays holding the flat index
+        (in the node grid) of the nodes they link, and an array holding the
+        coordinates of the cell each edge goes through.
+        The first node of each edge is always the one with the lowest coordinates.
+        """
+        nodes = self.cells_mask[::2, ::2]
+        node_x, node_y = np.indices(nodes.shape)
+        if self.disposition == 'hexagonal':
+            # Coloring the nodes with `(x + y) % 3` gives different colors to adjacent nodes,
+            # removing one color leaves a honeycomb.
+            nodes = nodes & ((node_x + node_y) % 3 != 0)
+        n_x, n_y = nodes.shape
+        node_ids = np.full(nodes.shape, -1, dtype='int64')
+        node_ids[nodes] = np.arange(np.count_nonzero(nodes))
+
+        edges_u, edges_v, edges_cells = [], [], []
+        for offset_x, offset_y in self.offsets:
+            # Only keep half of the offsets, so that each edge is listed once
+            if offset_x < 0 or offset_y < 0 or (offset_x, offset_y) == (0, 0):
+                continue
+            u = node_ids[:n_x - offset_x, :n_y - offset_y]
+            v = node_ids[offset_x:, offset_y:]
+            valid = (u >= 0) & (v >= 0)
+            edges_u.append(u[valid])
+            edges_v.append(v[valid])
+            cells_x = 2 * node_x[:n_x - offset_x, :n_y - offset_y][valid] + offset_x
+            cells_y = 2 * node_y[:n_x - offset_x, :n_y - offset_y][valid] + offset_y
+            edges_cells.append(np.stack([cells_x, cells_y], axis=1))
+
+        return nodes, np.concatenate(edges_u), np.concatenate(edges_v), np.concatenate(edges_cells)
+
+    @staticmethod
+    def get_adjacency(nodes_number: int, edges_u: np.array, edges_v: np.array) -> Tuple[list, list, list]:
+        """
+        Returns the adjacency of the nodes, in compressed sparse row format:
+        the neighbours of node `n` are `neighbours[indptr[n]:indptr[n + 1]]`,
+        reached through edges `edges[indptr[n]:indptr[n + 1]]`.
+        Lists are returned, as they are faster than arrays to index one item at a time.
+        """
+        edges_ids = np.arange(len(edges_u))
+        sources = np.concatenate([edges_u, edges_v])
+        order = np.argsort(sources, kind='stable')
+        neighbours = np.concatenate([edges_v, edges_u])[order]
+        edges = np.concatenate([edges_ids, edges_ids])[order]
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=nodes_number))])
+        return indptr.tolist(), neighbours.tolist(), edges.tolist()
+
+    def select_edges(self, nodes_number: int, edges_u: np.array, edges_v: np.array) -> np.array:
+        """
+        Returns a boolean array indicating which edges are part of the maze.
+        They must form a spanning tree of the nodes.
+        """
+        raise NotImplementedError()
+
+    def generate_content(self) -> np.array:
+        content = self.get_empty_content()
+        nodes, edges_u, edges_v, edges_cells = self.get_graph()
+        selected = self.select_edges(np.count_nonzero(nodes), edges_u, edges_v)
+
+        empty = Empty().identifier
+        content[::2, ::2][nodes] = empty
+        content[edges_cells[selected, 0], edges_cells[selected, 1]] = empty
+        return content
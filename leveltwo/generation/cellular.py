@@ -0,0 +1,148 @@
+import numpy as np
+
+from typing import Optional, Tuple
+
+from .base import MazeGenerator
+
+from ..database.init.default_objects import Empty
+
+
+class CellularAutomaton(MazeGenerator):
+
+    """
+    Generates caves: cells are randomly filled with walls,
+    then smoothed by a cellular automaton, in which a cell becomes a wall
+    when enough of its neighbourhood is made of walls.
+    Only the largest open region is kept, the others being filled with walls.
+    Everything is done with array operations.
+
+    Parameters
+    ----------
+
+    fill_probability: float
+        Probability of each cell to be a wall initially.
+
+    iterations: int
+        Number of smoothing iterations.
+
+    """
+
+    name = 'Cave'
+
+    # Number of caves drawn before giving up, if they are all too small (see `generate_content()`)
+    max_attempts = 20
+
+    def __init__(self, size: Tuple[int, int], disposition: str = 'square', seed: Optional[int] = None,
+                 fill_probability: float = 0.45, iterations: int = 4):
+        super().__init__(size, disposition, seed)
+        self.fill_probability = fill_probability
+        self.iterations = iterations
+
+        if self.disposition == 'square':
+            # Moore neighbourhood (including diagonals), and the cell itself
+            self.neighbourhood = [(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1)]
+        else:
+            self.neighbourhood = [(0, 0)] + list(self.offsets)
+        # A cell becomes a wall if more than half of its neighbourhood is
+        self.threshold = len(self.neighbourhood) // 2 + 1
+
+    def count_walls(self, walls: np.array) -> np.array:
+        """
+        Returns, for each cell, how many cells of its neighbourhood are walls.
+        Cells outside the level count as walls.
+        """
+        s_x, s_y = walls.shape
+        padded = np.pad(walls, 1, constant_values=True).astype('int8')
+        counts = np.zeros(walls.shape, dtype='int8')
+        for offset_x, offset_y in self.neighbourhood:
+            counts += padded[1 + offset_x:1 + offset_x + s_x, 1 + offset_y:1 + offset_y + s_y]
+        return counts
+
+    def get_largest_region(self, is_open: np.array) -> np.array:
+        """
+        Returns a boolean array marking the largest connected region of open cells.
+        Regions are labelled with a union-find working on all the cells at once:
+        each root is hooked to the smallest root it is linked to,
+        and the trees are then flattened, until nothing changes.
+        """
+        s_x, s_y = is_open.shape
+        open_cells_number = int(np.count_nonzero(is_open))
+        if open_cells_number == 0:
+            return is_open
+        # Identifiers of the open cells, only those are labelled
+        ids = np.full(is_open.shape, -1, dtype='int32')
+        ids[is_open] = np.arange(open_cells_number, dtype='int32')
+
+        # Links between adjacent open cells
+        sources, targets = [], []
+        for offset_x, offset_y in self.offsets:
+            if offset_x < 0 or offset_y < 0:
+                # Links are symmetric, only keep half of the offsets
+                continue
+            a = ids[:s_x - offset_x, :s_y - offset_y]
+            b = ids[offset_x:, offset_y:]
+            linked = (a >= 0) & (b >= 0)
+            sources.append(a[linked])
+            targets.append(b[linked])
+        sources = np.concatenate(sources)
+        targets = np.concatenate(targets)
+
+        parents = np.arange(open_cells_number, dtype='int32')
+        while True:
+            roots_s = parents[sources]
+            roots_t = parents[targets]
+            different = roots_s != roots_t
+            if not different.any():
+                break
+            # Links whose ends are already in the same region are not needed anymore
+            sources = sources[different]
+            targets = targets[different]
+            roots_s = roots_s[different]
+            roots_t = roots_t[different]
+            np.minimum.at(parents, np.maximum(roots_s, roots_t), np.minimum(roots_s, roots_t))
+            # Flatten the trees
+            while True:
+                grand_parents = parents[parents]
+                if np.array_equal(grand_parents, parents):
+                    break
+                parents = grand_parents[grand_parents]
+
+        largest = np.bincount(parents).argmax()
+        region = np.zeros(is_open.shape, dtype='bool')
+        region[is_open] = parents == largest
+        return region
+
+    def carve_minimal_region(self) -> np.array:
+        """
+        Returns a boolean array marking two adjacent cells, around the center of the level.
+        """
+        s_x, s_y = self.size
+        is_open = np.zeros(self.size, dtype='bool')
+        x, y = s_x // 2, s_y // 2
+        for offset_x, offset_y in self.offsets:
+            adj_x, adj_y = x + offset_x, y + offset_y
+            if 0 <= adj_x < s_x and 0 <= adj_y < s_y and self.cells_mask[adj_x, adj_y]:
+                is_open[x, y] = is_open[adj_x, adj_y] = True
+                break
+        return is_open
+
+    def generate_content(self) -> np.array:
+        # On small levels, the automaton can fill (almost) everything with walls,
+        # in which case the cave is drawn again, with the next numbers of the generator.
+        # Some levels are too small to ever hold a cave, a minimal one is then carved.
+        for _ in range(self.max_attempts):
+            walls = self.rng.random(self.size) < self.fill_probability
+            walls |= ~self.cells_mask
+            for _ in range(self.iterations):
+                walls = self.count_walls(walls) >= self.threshold
+                walls |= ~self.cells_mask
+
+            is_open = self.get_largest_region(~walls)
+            if np.count_nonzero(is_open) >= 2:
+                break
+        else:
+            is_open = self.carve_minimal_region()
+
+        content = self.get_empty_content()
+        content[is_open] = Empty().identifier
+        return content
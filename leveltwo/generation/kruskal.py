@@ -0,0 +1,39 @@
+import numpy as np
+
+from .base import PerfectMazeGenerator
+
+
+class Kruskal(PerfectMazeGenerator):
+
+    """
+    Randomized Kruskal's algorithm: edges are considered in a random order,
+    and kept if they link two nodes not yet connected, which is tracked with a union-find.
+    Produces mazes with many short dead-ends.
+    """
+
+    name = 'Kruskal'
+
+    def select_edges(self, nodes_number: int, edges_u: np.array, edges_v: np.array) -> np.array:
+        selected = np.zeros(len(edges_u), dtype='bool')
+        parents = list(range(nodes_number))
+
+        def find(node: int) -> int:
+            # Path halving
+            while parents[node] != node:
+                parents[node] = parents[parents[node]]
+                node = parents[node]
+            return node
+
+        order = self.rng.permutation(len(edges_u))
+        remaining = nodes_number - 1
+        for edge, u, v in zip(order.tolist(), edges_u[order].tolist(), edges_v[order].tolist()):
+            root_u = find(u)
+            root_v = find(v)
+            if root_u != root_v:
+                parents[root_u] = root_v
+                selected[edge] = True
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+        return selected
@@ -0,0 +1,40 @@
+import numpy as np
+
+from .base import PerfectMazeGenerator
+
+
+class Wilson(PerfectMazeGenerator):
+
+    """
+    Wilson's algorithm: loop-erased random walks from each node outside the maze,
+    until they hit it. Produces uniform spanning trees, that is, unbiased mazes.
+    It is the slowest of the generators on large levels.
+    """
+
+    name = 'Wilson'
+
+    def select_edges(self, nodes_number: int, edges_u: np.array, edges_v: np.array) -> np.array:
+        indptr, neighbours, edges = self.get_adjacency(nodes_number, edges_u, edges_v)
+        selected = bytearray(len(edges_u))
+        in_maze = bytearray(nodes_number)
+        # Index, in the adjacency, of the last move made from each node during the current walk.
+        # Overwriting it when a node is visited again erases the loops.
+        moves = [0] * nodes_number
+
+        in_maze[self.random.randrange(nodes_number)] = 1
+        for start in self.rng.permutation(nodes_number).tolist():
+            # Random walk until the maze is hit
+            node = start
+            while not in_maze[node]:
+                i = self.random.randrange(indptr[node], indptr[node + 1])
+                moves[node] = i
+                node = neighbours[i]
+            # Add the loop-erased walk to the maze
+            node = start
+            while not in_maze[node]:
+                in_maze[node] = 1
+                i = moves[node]
+                selected[edges[i]] = 1
+                node = neighbours[i]
+
+        return np.frombuffer(selected, dtype='bool')
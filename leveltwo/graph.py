@@ -0,0 +1,110 @@
+"""
+Implements the graph of the cells of a level, shared by the algorithms.
+"""
+
+import numpy as np
+
+from typing import List, Optional, Tuple
+
+from .level import GenericLevel
+from .topology import Offsets, get_neighbour_offsets
+
+
+class LevelGraph:
+
+    """
+    Adjacency of the traversable cells of a level, in compressed sparse row format.
+
+    Nodes are the cells, identified by their flat index in the content, `x * s_y + y`.
+    The edges leaving node `n` are those between `indptr[n]` and `indptr[n + 1]`:
+    `indices` holds the node they lead to, `weights` the cost of entering it,
+    and `directions` the index of the offset followed.
+    Within a node, edges are sorted by direction.
+
+    The graph is built with array operations, and is not updated
+    if the level is modified afterwards.
+
+    Parameters
+    ----------
+
+    level: GenericLevel
+        The level to build the graph of. Its objects must be set.
+
+    offsets: Offsets, optional
+        Offsets, on the `x` and `y` axis, from a cell to each of its adjacent cells,
+        which define the directions. Default is the ones of the level disposition.
+
+    traversable: np.array, optional
+        Boolean array indicating which cells are part of the graph.
+        Default is the cells that can be walked on (see `GenericLevel.traversable_mask`).
+
+    """
+
+    def __init__(self, level: GenericLevel, offsets: Optional[Offsets] = None,
+                 traversable: Optional[np.array] = None):
+        if offsets is None:
+            offsets = get_neighbour_offsets(level.disposition)
+        self.offsets = offsets
+        self.shape = level.content.shape
+        s_x, s_y = self.shape
+
+        if traversable is None:
+            traversable = level.traversable_mask
+        self.traversable = traversable
+        # For each cell and direction, whether there is an edge.
+        linked = np.zeros((s_x, s_y, len(offsets)), dtype='bool')
+        for direction, (offset_x, offset_y) in enumerate(offsets):
+            sources = (slice(max(-offset_x, 0), s_x + min(-offset_x, 0)),
+                       slice(max(-offset_y, 0), s_y + min(-offset_y, 0)))
+            targets = (slice(max(offset_x, 0), s_x + min(offset_x, 0)),
+                       slice(max(offset_y, 0), s_y + min(offset_y, 0)))
+            linked[sources + (direction,)] = self.traversable[sources] & self.traversable[targets]
+        linked = linked.reshape(s_x * s_y, len(offsets))
+
+        # Non-zero items are listed by node, then by direction
+        nodes, directions = np.nonzero(linked)
+        flat_offsets = np.array([offset_x * s_y + offset_y for offset_x, offset_y in offsets], dtype='int64')
+        self.indptr: np.array = np.concatenate([[0], np.cumsum(np.count_nonzero(linked, axis=1))])
+        self.indices: np.array = nodes + flat_offsets[directions]
+        self.directions: np.array = directions.astype('int8')
+        self.weights: np.array = level.cost_grid.ravel()[self.indices]
+
+        # Lists of the arrays above, see `get_adjacency_lists()`.
+        self._adjacency_lists: Optional[Tuple[List[int], List[int], List[int]]] = None
+
+    @property
+    def nodes_number(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def edges_number(self) -> int:
+        return len(self.indices)
+
+    def get_node(self, x: int, y: int) -> int:
+        return int(x) * self.shape[1] + int(y)
+
+    def get_position(self, node: int) -> Tuple[int, int]:
+        return divmod(node, self.shape[1])
+
+    def get_adjacency_lists(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Returns `indptr`, `indices` and `weights` as lists,
+        which are faster than arrays to index one item at a time.
+        They are converted once, on the first call.
+        """
+        if self._adjacency_lists is None:
+            self._adjacency_lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._adjacency_lists
+
+    def get_neighbours(self, node: int) -> np.array:
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def get_neighbour(self, node: int, direction: int) -> Optional[int]:
+        """
+        Returns the node adjacent to `node` in the direction passed,
+        None if there is no edge between them.
+        """
+        start, end = self.indptr[node], self.indptr[node + 1]
+        for edge in range(start, end):
+            if self.directions[edge] == direction:
+                return int(self.indices[edge])
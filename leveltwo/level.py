@@ -4,6 +4,7 @@ from typing import Tuple, List, Optional, Generator
 from datetime import datetime
 
 from .object import GenericObject
+from .topology import get_neighbour_offsets
 from .database.models import LevelDBO
 from .utils import string_to_list, list_to_string
 
@@ -16,13 +17,35 @@ class GenericLevel:
         self.name = name
         self.author = author
         self.disposition = disposition
+        # Number of occurrences of each object in the content, indexed by object identifier.
+        # Computed on demand (see `get_objects_occurrences()`), then maintained by the edits.
+        self._objects_occurrences: Optional[np.array] = None
         self.content = content
         self.creation_date = creation_date
         self.last_modification_date = last_modification_date
 
-        self.objects_map = None
         self.objects = None
 
+        # Lookup tables, indexed by object identifier (see `set_objects()`).
+        # Index `0` stands for an invalid cell.
+        self.objects_table: Optional[List[Optional[GenericObject]]] = None
+        self.traversable_table: Optional[np.array] = None
+        self.effect_table: Optional[np.array] = None
+        self.cost_table: Optional[np.array] = None
+
+        # Copy of the content, as it is stored in the database (see `mark_as_stored()`).
+        # None if the content has never been stored.
+        self.stored_content: Optional[np.array] = None
+
+    @property
+    def content(self) -> np.array:
+        return self._content
+
+    @content.setter
+    def content(self, content: np.array) -> None:
+        self._content = content
+        self._objects_occurrences = None
+
     @classmethod
     def from_dbo(cls, dbo: LevelDBO):
         """
@@ -55,8 +78,69 @@ class GenericLevel:
         last_modification_date = datetime.utcnow()
         return cls(identifier, name, author, disposition, content, creation_date, last_modification_date)
 
+    def copy(self) -> 'GenericLevel':
+        """
+        Returns a copy of the level, with its own content.
+        """
+        level = GenericLevel(self.identifier, self.name, self.author, self.disposition,
+                             self.content.copy(), self.creation_date, self.last_modification_date)
+        if self.objects is not None:
+            level.set_objects(self.objects)
+        if self._objects_occurrences is not None:
+            level._objects_occurrences = self._objects_occurrences.copy()
+        # Never modified in place, so it can be shared
+        level.stored_content = self.stored_content
+        return level
+
     def set_objects(self, objects: List[GenericObject]) -> None:
         self.objects = objects
+        self.construct_lookup_tables()
+
+    def construct_lookup_tables(self) -> None:
+        """
+        Builds tables holding the properties of each object, indexed by their identifier.
+        Indexing these tables with the level content gives the property of each cell,
+        without creating any Python object per cell.
+        """
+        assert self.objects
+
+        size = max(obj.identifier for obj in self.objects) + 1
+        self.objects_table = [None] * size
+        self.traversable_table = np.zeros(size, dtype='bool')
+        self.effect_table = np.zeros(size, dtype='int8')
+        self.cost_table = np.ones(size, dtype='int8')
+        for obj in self.objects:
+            self.objects_table[obj.identifier] = obj
+            self.traversable_table[obj.identifier] = obj.traversable
+            self.effect_table[obj.identifier] = obj.effect.value
+            self.cost_table[obj.identifier] = obj.cost
+
+    @property
+    def traversable_mask(self) -> np.array:
+        """
+        Boolean array indicating whether each cell can be walked on.
+        """
+        return self.traversable_table[self.content]
+
+    @property
+    def effect_grid(self) -> np.array:
+        """
+        Array holding the effect (see `Effects`) of each cell.
+        """
+        return self.effect_table[self.content]
+
+    @property
+    def cost_grid(self) -> np.array:
+        """
+        Array holding the cost of walking on each cell.
+        """
+        return self.cost_table[self.content]
+
+    def get_cell_object(self, x: int, y: int) -> Optional[GenericObject]:
+        """
+        Returns the object in the cell at `x` and `y`, None if the cell is invalid.
+        """
+        return self.objects_table[self.content[x, y]]
 
     def iterate_over_shape(self) -> Generator[Tuple[int, int], None, None]:
         s_x, s_y = self.content.shape
@@ -65,25 +149,54 @@ class GenericLevel:
                 if self.content[x, y] != 0:
                     yield x, y
 
-    def construct_object_content(self):
+    def mark_as_stored(self) -> None:
         """
-        Takes the content of the level, and converts the integers to GenericObjects.
-        Use sparsely, as it can be rather computationally expensive.
+        Signals that the current content is the one stored in the database.
         """
-        assert self.objects
+        self.stored_content = self.content.copy()
 
-        self.object_map = np.empty(self.content.shape, dtype='object')
-        s_x, s_y = self.content.shape
-        for x in range(s_x):
-            for y in range(s_y):
-                object_id = self.content[x, y]
-                self.object_map[x, y] = self.objects[object_id - 1]
+    def get_modified_cells(self) -> np.array:
+        """
+        Returns the coordinates of the cells modified since the content was last stored,
+        as an array of shape `(n, 2)`.
+        All the cells are returned if the content has never been stored.
+        """
+        if self.stored_content is None or self.stored_content.shape != self.content.shape:
+            return np.argwhere(np.ones(self.content.shape, dtype='bool'))
+        return np.argwhere(self.content != self.stored_content)
+
+    def get_objects_occurrences(self) -> np.array:
+        """
+        Returns the number of occurrences of each object in the content,
+        indexed by object identifier.
+        It is counted once, and then updated by `set_cell_object()` and `set_cells_object()`:
+        if the content is modified in place by other means, `count_objects()` must be called.
+        """
+        if self._objects_occurrences is None:
+            self.count_objects()
+        return self._objects_occurrences
+
+    def count_objects(self) -> None:
+        """
+        Counts the occurrences of each object in the content.
+        """
+        self._objects_occurrences = np.bincount(self.content.ravel())
+
+    def _add_objects_occurrences(self, object_id: int, number: int) -> None:
+        occurrences = self.get_objects_occurrences()
+        if object_id >= len(occurrences):
+            occurrences = np.concatenate([occurrences, np.zeros(object_id + 1 - len(occurrences), dtype='int64')])
+            self._objects_occurrences = occurrences
+        occurrences[object_id] += number
 
     def get_number_of_objects_in(self, object_id: int) -> int:
         """
         Gets number of occurrences of the object in the content.
         """
-        return self.content[self.content == object_id].size
+        occurrences = self.get_objects_occurrences()
+        if object_id >= len(occurrences):
+            return 0
+        return int(occurrences[object_id])
 
     def is_object_occurrences_in_limits(self, obj: GenericObject) -> bool:
         """
@@ -96,9 +209,10 @@ class GenericLevel:
     def get_objects_occurrences_anomalies(self, objects: List[GenericObject]) -> dict:
         anomalies = {}
         for obj in objects:
-            if not self.is_object_occurrences_in_limits(obj):
+            occurrences = self.get_number_of_objects_in(obj.identifier)
+            if not obj.min_instances <= occurrences <= obj.max_instances:
                 anomalies.update({obj.name: {
-                    'current': self.get_number_of_objects_in(obj.identifier),
+                    'current': occurrences,
                     'min': obj.min_instances,
                     'max': obj.max_instances
                 }})
@@ -106,8 +220,65 @@ class GenericLevel:
 
     def set_cell_object(self, x: int, y: int, obj: GenericObject) -> None:
         if self.get_number_of_objects_in(obj.identifier) < obj.max_instances:
+            self._add_objects_occurrences(self.content[x, y], -1)
+            self._add_objects_occurrences(obj.identifier, 1)
             self.content[x, y] = obj.identifier
 
+    def set_cells_object(self, cells: np.array, obj: GenericObject) -> np.array:
+        """
+        Sets the object of several cells at once, as long as its number of occurrences
+        stays within its limits: if the limit is reached, only the first cells are set.
+        Invalid cells, and cells already holding the object, are left untouched.
+
+        :param np.array cells: Coordinates of the cells, as an array of shape `(n, 2)`.
+        :return np.array: Coordinates of the cells actually modified.
+        """
+        cells = np.asarray(cells, dtype='int64').reshape(-1, 2)
+        # Remove duplicates, keeping the order
+        _, first_indices = np.unique(cells, axis=0, return_index=True)
+        cells = cells[np.sort(first_indices)]
+
+        current = self.content[cells[:, 0], cells[:, 1]]
+        cells = cells[(current != 0) & (current != obj.identifier)]
+
+        available = max(obj.max_instances - self.get_number_of_objects_in(obj.identifier), 0)
+        cells = cells[:available]
+        previous = self.content[cells[:, 0], cells[:, 1]]
+        self.content[cells[:, 0], cells[:, 1]] = obj.identifier
+
+        self._add_objects_occurrences(obj.identifier, len(cells))
+        occurrences = self.get_objects_occurrences()
+        occurrences -= np.bincount(previous, minlength=len(occurrences))
+        return cells
+
+    def get_region(self, x: int, y: int) -> np.array:
+        """
+        Returns the coordinates of the cells connected to the one at `x` and `y`
+        which hold the same object (as used by a flood fill),
+        as an array of shape `(n, 2)`.
+        """
+        s_x, s_y = self.content.shape
+        # Padded with a border of other cells, so that neighbours never are out of bounds
+        padded_s_y = s_y + 2
+        same = np.zeros((s_x + 2, padded_s_y), dtype='bool')
+        same[1:-1, 1:-1] = self.content == self.content[x, y]
+        same = same.ravel().tolist()
+
+        flat_offsets = [offset_x * padded_s_y + offset_y
+                        for offset_x, offset_y in get_neighbour_offsets(self.disposition)]
+        start = (x + 1) * padded_s_y + (y + 1)
+        same[start] = False
+        region = [start]
+        for cell in region:  # The list grows while iterating, as a queue
+            for offset in flat_offsets:
+                neighbour = cell + offset
+                if same[neighbour]:
+                    same[neighbour] = False
+                    region.append(neighbour)
+
+        region_x, region_y = np.divmod(np.array(region), padded_s_y)
+        return np.stack([region_x - 1, region_y - 1], axis=1)
+
     def _get_object_coordinates(self, object_id: int) -> np.array:
         return np.argwhere(self.content == object_id)
 
@@ -140,6 +311,25 @@ class GenericLevel:
         return cell_index[0], cell_index[1]
 
 
+class LevelSummary:
+
+    """
+    Metadata of a level, without its content.
+    The content can then be loaded on demand with `Database.construct_level()`.
+    """
+
+    def __init__(self, identifier: int, name: str, author: str, disposition: str, shape: Tuple[int, int],
+                 creation_date: datetime, last_modification_date: datetime, tests_count: int):
+        self.identifier = identifier
+        self.name = name
+        self.author = author
+        self.disposition = disposition
+        self.shape = shape
+        self.creation_date = creation_date
+        self.last_modification_date = last_modification_date
+        self.tests_count = tests_count
+
+
 class GenericLevelContent:
 
     def __init__(self, level_id: int, x: int, y: int, value: int):
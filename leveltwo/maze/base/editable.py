@@ -6,25 +6,36 @@ import numpy as np
 from tkinter import Tk
 from tkinter import messagebox
 
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Iterable, List
 
 from .maze import Maze
-from .base import Viewport, BoundType
+from .base import Viewport
 
 from ...enums import Colors
+from ...object import GenericObject
 from ...database import Database
 from ...sprites.object_to_color import ObjectToColor
 
 
 class MazeEditable(Maze, ABC):
 
+    # Keys selecting how the cells are painted:
+    # - brush: cells are painted while the mouse is dragged
+    # - rectangle: the rectangle between the cells the mouse is pressed and released on is filled
+    # - fill: the region of identical cells connected to the one clicked is filled
+    brush_modes = {
+        pygame.K_b: 'brush',
+        pygame.K_r: 'rectangle',
+        pygame.K_f: 'fill',
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.buttons_coordinates_matrix = np.empty((len(self.objects), 4))
         self.manipulation_buttons: Dict[str, pygame.Rect] = {}
+        self.brush_mode: str = 'brush'
 
     def draw(self):
-        self.draw_grid()
+        self.screen.blit(self.get_background(), (0, 0))
         self.draw_toolbox()
 
         toolbox_vp = self.viewports['toolbox']
@@ -33,6 +44,51 @@ class MazeEditable(Maze, ABC):
 
         pygame.display.update()
 
+    def update_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Draws the cells passed, on both the screen and the cached grid,
+        and only updates their area of the display.
+        """
+        background = self.get_background()
+        rects = []
+        for x, y in cells:
+            color = self.get_cell_color(x, y)
+            self.draw_cell(background, x, y, color)
+            rects.append(self.draw_cell(self.screen, x, y, color))
+        if rects:
+            # Update the area around all the cells at once
+            pygame.display.update(rects[0].unionall(rects[1:]))
+
+    def paint(self, cells: np.array, obj: GenericObject) -> None:
+        """
+        Sets the object of the cells passed, as one batch, and redraws the ones modified.
+        """
+        modified_cells = self.level.set_cells_object(cells, obj)
+        self.update_cells(modified_cells.tolist())
+
+    def get_cells_between(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Returns the cells under the segment between two positions on the screen,
+        so that no cell is skipped when the mouse moves fast.
+        """
+        (start_x, start_y), (end_x, end_y) = start, end
+        z_x, z_y = self.get_z()
+        # Sample the segment every half cell
+        step = max(min(z_x, z_y) // 2, 1)
+        samples = max(abs(end_x - start_x), abs(end_y - start_y)) // step + 1
+        cells = []
+        for x, y in zip(np.linspace(start_x, end_x, samples + 1), np.linspace(start_y, end_y, samples + 1)):
+            cell = self.get_clicked_cell_index(int(x), int(y))
+            if cell is not None and (not cells or cells[-1] != cell):
+                cells.append(cell)
+        return cells
+
+    @staticmethod
+    def get_cells_in_rectangle(corner: Tuple[int, int], opposite_corner: Tuple[int, int]) -> np.array:
+        (x_1, y_1), (x_2, y_2) = corner, opposite_corner
+        x, y = np.mgrid[min(x_1, x_2):max(x_1, x_2) + 1, min(y_1, y_2):max(y_1, y_2) + 1]
+        return np.stack([x.ravel(), y.ravel()], axis=1)
+
     def get_toolbox_buttons_size(self) -> Tuple[int, int]:
         button_width = 100
         button_height = button_width // 2
@@ -54,9 +110,6 @@ class MazeEditable(Maze, ABC):
 
         total_side_length = left_margin + button_width + right_margin
 
-        # Reset buttons coordinates matrix
-        self.buttons_coordinates_matrix = np.empty((len(self.objects), 4))
-
         # Get toolbox viewport coordinates.
         # We want to stick this viewport to the right side of the grid.
         grid_viewport = self.viewports['grid']
@@ -79,6 +132,8 @@ class MazeEditable(Maze, ABC):
         label = pygame.font.SysFont('calibri', 20)
         menu_label = label.render("ToolBox", True, Colors.BLACK)
         self.screen.blit(menu_label, (x, 5))
+        brush_mode_label = label.render(f"Mode: {self.brush_mode}", True, Colors.BLACK)
+        self.screen.blit(brush_mode_label, (x, 5 + menu_label.get_height()))
 
         for i, item in enumerate(self.objects):
 
@@ -87,20 +142,13 @@ class MazeEditable(Maze, ABC):
 
             # Display label for this item
             title = label.render(item.name, True, Colors.WHITE)
-            # Draw the rectangle. We'll keep it in order to know when the user clicks on it.
+            # Draw the rectangle.
+            # Clicks on it are found from their coordinates (see `get_clicked_button_index()`).
             rectangle = pygame.Rect(x, y, button_width, title.get_height())
             color = ObjectToColor[item.name].value
             pygame.draw.rect(self.screen, color, rectangle)
             self.screen.blit(title, (x, y))
 
-            # Get coordinates
-            origin_x = x
-            origin_y = y
-            end_x = origin_x + button_width
-            end_y = origin_y + button_height
-            # And update the matrix
-            self.buttons_coordinates_matrix[i] = np.array([origin_x, origin_y, end_x, end_y])
-
         # Starting from the window lower edge, we'll display the labels up `n` pixels
         n = 100
         manipulation_labels_y = viewport_end_y - n
@@ -137,50 +185,31 @@ class MazeEditable(Maze, ABC):
         self.screen.blit(last_modified_intro_label, (x, last_modified_intro_label_y))
         self.screen.blit(last_modified_label, (x, last_modified_label_y))
 
-    def get_button_bounds(self, x: int, y: int, z: Tuple[int, int]) -> BoundType:
-        """
-        Given `x` and `y` (coordinates), return a 4-tuple of integers
-        delimiting the bounds of a toolbox button.
-        """
-        button_width, button_height = self.get_toolbox_buttons_size()
-        left_margin, top_margin, _, _ = self.get_toolbox_margins()
-        toolbox_viewport = self.viewports['toolbox']
-        x_offset = toolbox_viewport.origin_x
-
-        z_x, z_y = z
-
-        remainder_x = x % x_offset % z_x
-        remainder_y = y % z_y
-
-        origin_x = x - remainder_x + left_margin
-        origin_y = y - remainder_y + top_margin
-        end_x = origin_x + button_width
-        end_y = origin_y + button_height
-
-        return origin_x, origin_y, end_x, end_y
-
     def get_clicked_button_index(self, x: int, y: int) -> Optional[int]:
         """
-        Iterates through the buttons matrix and returns the one the user clicked on,
-        based on the coordinates of his input.
+        Returns the index of the toolbox button the user clicked on,
+        based on the coordinates of his input, None if he did not click on any.
+        Buttons are stacked one under the other, so the index is deduced from the coordinates.
 
         :param int x:
         :param int y:
         :return int: The index of the button clicked on.
         """
-        b = self.get_toolbox_buttons_size()
-        searching_for = self.get_button_bounds(x, y, z=b)
-        cell_index = np.where((self.buttons_coordinates_matrix == searching_for).all(axis=1))
-        try:
-            index = int(cell_index[0])
-            return index
-        except (TypeError, IndexError):
+        button_width, button_height = self.get_toolbox_buttons_size()
+        left_margin, _, _, _ = self.get_toolbox_margins()
+        toolbox_viewport = self.viewports['toolbox']
+        buttons_x = toolbox_viewport.origin_x + left_margin
+        if not buttons_x <= x < buttons_x + button_width:
             return
+        # The first button is one button lower than the top of the toolbox
+        index = (y - toolbox_viewport.origin_y) // button_height - 1
+        if 0 <= index < len(self.objects):
+            return index
 
-    def get_clicked_cell_index(self, x: int, y: int) -> Tuple[int, int]:
+    def get_clicked_cell_index(self, x: int, y: int) -> Optional[Tuple[int, int]]:
         """
-        Iterates through the cells matrix and returns the coordinates of the
-        one the user clicked on, based on the coordinates of his input.
+        Returns the coordinates of the cell the user clicked on,
+        based on the coordinates of his input, None if he did not click on any.
         """
         raise NotImplementedError()
 
@@ -212,6 +241,10 @@ class MazeEditable(Maze, ABC):
         self.draw()
         # Select the first item of the list as default (should be object `Empty`)
         selected_object = self.objects[0]
+        # Last position of the mouse while painting with the brush, None when not painting
+        brush_position: Optional[Tuple[int, int]] = None
+        # Cell the mouse was pressed on, in rectangle mode
+        rectangle_corner: Optional[Tuple[int, int]] = None
         while self._running:
             for event in pygame.event.get():
 
@@ -222,9 +255,21 @@ class MazeEditable(Maze, ABC):
                 if event.type == pygame.VIDEORESIZE:
                     self.resize(event.w, event.h, self.draw)
 
+                if event.type == pygame.KEYDOWN and event.key in self.brush_modes:
+                    self.brush_mode = self.brush_modes[event.key]
+                    self.draw()
+
                 mouse_x, mouse_y = pygame.mouse.get_pos()
                 selected_viewport = self.get_selected_viewport(mouse_x, mouse_y)
 
+                if event.type == pygame.MOUSEBUTTONUP:
+                    brush_position = None
+                    if rectangle_corner is not None:
+                        cell = self.get_clicked_cell_index(mouse_x, mouse_y)
+                        if cell is not None:
+                            self.paint(self.get_cells_in_rectangle(rectangle_corner, cell), selected_object)
+                        rectangle_corner = None
+
                 if selected_viewport.name == 'toolbox':  # If in the toolbox area.
                     if event.type == pygame.MOUSEBUTTONDOWN:
 
@@ -241,10 +286,18 @@ class MazeEditable(Maze, ABC):
 
                 if selected_viewport.name == 'grid':  # If in the maze - grid - area.
                     if event.type == pygame.MOUSEBUTTONDOWN:
-                        x, y = self.get_clicked_cell_index(mouse_x, mouse_y)
-
-                        # Set the cell's object in the level content if within limits.
-                        self.level.set_cell_object(x, y, selected_object)
-                        self.draw()
-
-            pygame.display.update()
+                        cell = self.get_clicked_cell_index(mouse_x, mouse_y)
+                        if cell is not None:
+                            # Set the cells' object in the level content if within limits.
+                            if self.brush_mode == 'brush':
+                                brush_position = (mouse_x, mouse_y)
+                                self.paint([cell], selected_object)
+                            elif self.brush_mode == 'rectangle':
+                                rectangle_corner = cell
+                            elif self.brush_mode == 'fill':
+                                self.paint(self.level.get_region(*cell), selected_object)
+
+                    if event.type == pygame.MOUSEMOTION and brush_position is not None:
+                        cells = self.get_cells_between(brush_position, (mouse_x, mouse_y))
+                        self.paint(cells, selected_object)
+                        brush_position = (mouse_x, mouse_y)
@@ -1,13 +1,17 @@
 import pygame
 import numpy as np
 
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Iterable, List
 
-from .base import Viewport, BoundType
+from .base import Viewport
 
 from ...enums import Colors
 from ...database import Database
 from ...level import GenericLevel
+from ...sprites.object_to_color import ObjectToColor
+
+
+Color = Tuple[int, int, int]
 
 
 class Maze:
@@ -19,9 +23,16 @@ class Maze:
         db = Database()
         self.objects = db.get_all_objects()
 
-        self.cells_coordinates_matrix = self.init_cell_coordinates_matrix()
+        # Coordinates of the cells on the screen (see `get_cells_coordinates()`).
+        self.cells_coordinates_matrix: Optional[np.array] = None
+        self._cells_coordinates_key: Optional[tuple] = None
         self.viewports: Dict[str, Viewport] = {}
 
+        # The grid, as drawn from the level content, cached on a surface (see `get_background()`).
+        # It is drawn again only when the screen or the level size changes.
+        self.background: Optional[pygame.Surface] = None
+        self._background_key: Optional[tuple] = None
+
         self.screen_size = self.parent.screen_size
         self.screen = self.get_screen()
         self.adjust_style()
@@ -60,18 +71,75 @@ class Maze:
     def adjust_style(self) -> None:
         self.screen.fill(Colors.WHITE)  # Set the background color
 
-    def init_cell_coordinates_matrix(self) -> np.array:
+    def compute_cells_coordinates(self) -> np.array:
+        """
+        Computes the coordinates of all the cells on the screen at once,
+        as an array whose first two dimensions are the level's.
+        """
         raise NotImplementedError()
 
+    def get_cells_coordinates(self) -> np.array:
+        """
+        Returns the coordinates of the cells on the screen.
+        They are only computed again if the screen or the level has been resized since the last call.
+        """
+        key = (self.screen_size, self.level.content.shape)
+        if self.cells_coordinates_matrix is None or key != self._cells_coordinates_key:
+            self.cells_coordinates_matrix = self.compute_cells_coordinates()
+            self._cells_coordinates_key = key
+        return self.cells_coordinates_matrix
+
     def get_z(self) -> Tuple[int, int]:
         raise NotImplementedError()
 
-    def draw_grid(self) -> None:
+    def draw_grid(self, surface: pygame.Surface) -> None:
+        """
+        Constructs the maze's grid and draws each cell on the surface.
+        """
+        raise NotImplementedError()
+
+    def get_cell_rect(self, x: int, y: int) -> pygame.Rect:
+        """
+        Returns the area of the screen the cell at `x` and `y` is drawn in.
+        """
+        raise NotImplementedError()
+
+    def draw_cell(self, surface: pygame.Surface, x: int, y: int, color: Color) -> pygame.Rect:
         """
-        Constructs the maze's grid and draws rectangles for each cell on the screen.
+        Draws the cell at `x` and `y` on the surface, and returns the area drawn.
         """
         raise NotImplementedError()
 
+    def get_object_color(self, object_id: int) -> Color:
+        try:
+            # Objects are 1-indexed in the level content
+            return ObjectToColor[self.objects[object_id - 1].name].value
+        except (IndexError, KeyError):
+            return ObjectToColor.default.value
+
+    def get_cell_color(self, x: int, y: int) -> Color:
+        return self.get_object_color(self.level.content[x, y])
+
+    def get_background(self) -> pygame.Surface:
+        """
+        Returns the surface the grid is drawn on.
+        It is only drawn again if the screen or the level has been resized since the last call.
+        """
+        key = (self.screen_size, self.level.content.shape)
+        if self.background is None or key != self._background_key:
+            self.background = pygame.Surface(self.screen_size).convert()
+            self.background.fill(Colors.WHITE)
+            self.draw_grid(self.background)
+            self._background_key = key
+        return self.background
+
+    def redraw_cells(self, cells: Iterable[Tuple[int, int]]) -> List[pygame.Rect]:
+        """
+        Draws the cells passed on the screen, and returns the areas drawn,
+        which are the only ones to update on the display.
+        """
+        return [self.draw_cell(self.screen, x, y, self.get_cell_color(x, y)) for x, y in cells]
+
     def adjust_screen(self, callback, *, down_margin: int = 0, right_margin: int = 0) -> None:
         """
         Calculates the size each viewport should have on the screen,
@@ -90,29 +158,5 @@ class Maze:
             new_y = y - remainder_y
             self.resize(new_x, new_y, callback)
 
-    def get_bounds(self, x: int, y: int, z: Optional[Tuple[int, ...]] = None) -> BoundType:
-        """
-        Given two coordinates, `x` and `y`, returns the bounds of the square they land in.
-        Example (with `self.get_z()` returning `10`):
-        >>> self.get_bounds(4, 29)
-        (0, 20, 10, 30)
-        """
-        if z is None:
-            z = self.get_z()
-        z_x, z_y = z
-
-        x_remainder = x % z_x
-        y_remainder = y % z_y
-
-        x_lower = x - x_remainder
-        y_lower = y - y_remainder
-
-        x_upper = x_lower + z_x
-        y_upper = y_lower + z_y
-
-        bounds = (x_lower, y_lower, x_upper, y_upper)
-
-        return bounds
-
     def get_cell_center(self, x: int, y: int) -> Tuple[int, int]:
         raise NotImplementedError()
@@ -3,15 +3,18 @@ from abc import ABC
 import pygame
 
 from time import sleep
+from tkinter import Tk
+from tkinter import messagebox
 from datetime import datetime
-from typing import Tuple, List
+from typing import Iterable, Optional, Tuple
 
-from .maze import Maze
+from .maze import Maze, Color
 
 from ...test import Test
 from ...enums import Colors
 from ...database import Database
 from ...character import Character
+from ...sprites.object_to_color import ObjectToColor
 from ...algorithm.base import MazeSolvingAlgorithm, Manual
 
 
@@ -24,26 +27,51 @@ class MazePlayable(Maze, ABC):
         self.db = Database()
         objects = self.db.get_all_objects()
         self.level.set_objects(objects)
+        # Algorithm currently running, whose marks are displayed.
+        self.algorithm: Optional[MazeSolvingAlgorithm] = None
 
     def draw(self) -> None:
+        """
+        Draws the whole screen.
+        """
         self.adjust_screen(self.draw)
-        self.draw_grid()
+        self.screen.blit(self.get_background(), (0, 0))
+        if self.algorithm is not None:
+            self.redraw_cells(self.algorithm.get_marked_cells())
         self.draw_character()
         pygame.display.update()
 
+    def draw_character(self) -> None:
+        raise NotImplementedError()
+
+    def get_cell_color(self, x: int, y: int) -> Color:
+        if self.algorithm is not None:
+            mark = self.algorithm.get_mark(x, y)
+            if mark is not None:
+                return ObjectToColor[mark].value
+        return super().get_cell_color(x, y)
+
+    def update_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Draws the cells passed, along with the character,
+        and only updates their area of the display.
+        The character must be on one of these cells.
+        """
+        rects = self.redraw_cells(cells)
+        self.draw_character()
+        pygame.display.update(rects)
+
     def rerun(self, test: Test, delay: int = 0.5) -> None:
         """
         Takes a test, and runs it so as to visualize the steps the algorithm took.
         :param Test test: the test to run
         :param int delay: how long we should wait before displaying each step.
         """
-
-        def draw_path():
-            for line in path:
-                pygame.draw.line(self.screen, Colors.BLACK, *line)
-
+        self.algorithm = None
         self.draw()
-        path: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+        # The grid, on which the path is drawn as it goes.
+        # The areas changed at each step are copied from it to the screen.
+        frame = self.get_background().copy()
 
         delay = int(delay * 1000)  # Convert delay to milliseconds
         last_step = test.steps[0]
@@ -52,21 +80,23 @@ class MazePlayable(Maze, ABC):
 
             # Get the centers of this step and the last
             cell_x, cell_y = step
-            cell_center_x, cell_center_y = self.get_cell_center(cell_x, cell_y)
+            cell_center = self.get_cell_center(cell_x, cell_y)
             last_cell_x, last_cell_y = last_step
-            last_step_center_x, last_step_center_y = self.get_cell_center(last_cell_x, last_cell_y)
+            last_step_center = self.get_cell_center(last_cell_x, last_cell_y)
 
             # Move the character
             self.character.move(cell_x, cell_y)
 
             # And add a line between the two.
-            path.append(((cell_center_x, cell_center_y), (last_step_center_x, last_step_center_y)))
+            line_rect = pygame.draw.line(frame, Colors.BLACK, cell_center, last_step_center)
 
-            last_step = step
+            rects = [self.get_cell_rect(last_cell_x, last_cell_y), self.get_cell_rect(cell_x, cell_y), line_rect]
+            for rect in rects:
+                self.screen.blit(frame, rect, rect)
+            self.draw_character()
+            pygame.display.update(rects)
 
-            self.draw()
-            draw_path()
-            pygame.display.update()
+            last_step = step
 
         pygame.time.delay(800)
 
@@ -77,6 +107,7 @@ class MazePlayable(Maze, ABC):
         save: bool = False
         algo: MazeSolvingAlgorithm = algorithm_class(self.level, self.character)
         manual: bool = isinstance(algo, Manual)
+        self.algorithm = algo
 
         self.draw()
         while self._running:
@@ -102,17 +133,20 @@ class MazePlayable(Maze, ABC):
                 })
 
             # If not human-controller, advance the algorithm one step.
+            previous_location = self.character.location
             algo.run_one_step(**kwargs)
-            self.draw()
+            # Only the cells the character moved from and to have changed.
+            self.update_cells({previous_location, self.character.location})
             if not algo.is_running():
                 save = True
                 self._running = False
+                if not algo.is_solvable():
+                    Tk().wm_withdraw()
+                    messagebox.showwarning('No solution !', f'Could not find any solution to the maze !')
 
             if not manual:
                 sleep(0.2)
 
-            pygame.display.update()
-
         if save:
             # If we finished the level one way or another, we'll save the run in the database.
             test = Test(identifier=None,
@@ -2,12 +2,10 @@ import pygame
 import numpy as np
 
 from typing import Tuple
-from math import cos, sin, pi, sqrt, floor
+from math import cos, sin, pi, sqrt
 
 from ..base import Maze, Viewport
 
-from ...sprites.object_to_color import ObjectToColor
-
 
 def draw_ngon(surface, color, n, radius, position, display_border: bool = False):
     pi2 = 2 * pi
@@ -21,6 +19,22 @@ def draw_ngon(surface, color, n, radius, position, display_border: bool = False)
     return polygon
 
 
+def cube_round(q: float, r: float) -> Tuple[int, int]:
+    """
+    Rounds fractional axial coordinates to those of the hexagon they land in.
+    The third cube coordinate, `s = -q - r`, is used to fix
+    the coordinate which was rounded the furthest.
+    """
+    s = -q - r
+    rounded_q, rounded_r, rounded_s = round(q), round(r), round(s)
+    diff_q, diff_r, diff_s = abs(rounded_q - q), abs(rounded_r - r), abs(rounded_s - s)
+    if diff_q > diff_r and diff_q > diff_s:
+        rounded_q = -rounded_r - rounded_s
+    elif diff_r > diff_s:
+        rounded_r = -rounded_q - rounded_s
+    return rounded_q, rounded_r
+
+
 def find_nearest_point(array: np.array, point: Tuple[int, int]):
     idx = (np.abs(array - point)).argmin()
     return array[idx]
@@ -28,32 +42,39 @@ def find_nearest_point(array: np.array, point: Tuple[int, int]):
 
 class MazeHexagonal(Maze):
 
-    def init_cell_coordinates_matrix(self) -> np.array:
-        return np.empty((self.level.content.shape[0], self.level.content.shape[1], 2))
-
-    def draw_grid(self) -> None:
+    def get_hexagon_geometry(self) -> Tuple[int, int, float, float, float]:
         """
-        Constructs the maze's grid and draws rectangles for each cell on the screen.
+        Returns the size of the hexagons (the length between their center and any of their edges),
+        their width and height, and the horizontal and vertical offsets of the grid.
         """
-        z_x, z_y = self.get_z()
-        z = min(z_x, z_y)
         s_x, s_y = self.level.content.shape
-
-        # Size is the length between the center and any of the edges of the hexagon
-        size = (z // 2)
+        size = self.get_hexagon_size()
         hexagon_width = 2 * size
         hexagon_height = sqrt(3) * size
         horizontal_offset = -(hexagon_width * 0.25)
         vertical_offset = (s_x / 2) * size
+        return size, hexagon_width, hexagon_height, horizontal_offset, vertical_offset
 
-        for x_i, y_i in self.level.iterate_over_shape():
-            x = floor((x_i + 1) * (hexagon_width * 0.75) + horizontal_offset)
-            y = floor(-(x_i * (hexagon_height // 2)) + (y_i * hexagon_height) + vertical_offset)
+    def compute_cells_coordinates(self) -> np.array:
+        """
+        Returns an array of shape `(s_x, s_y, 2)` holding the center of each cell.
+        Each column is shifted up by half a hexagon from the previous one.
+        """
+        _, hexagon_width, hexagon_height, horizontal_offset, vertical_offset = self.get_hexagon_geometry()
+        x_i, y_i = np.indices(self.level.content.shape)
+        x = np.floor((x_i + 1) * (hexagon_width * 0.75) + horizontal_offset)
+        y = np.floor(y_i * hexagon_height - x_i * (hexagon_height / 2) + vertical_offset)
+        return np.stack([x, y], axis=-1).astype(int)
 
-            self.cells_coordinates_matrix[x_i, y_i] = np.array([x, y])
-            cell = self.level.content[x_i, y_i] - 1
-            color = ObjectToColor[self.objects[cell].name].value
-            draw_ngon(self.screen, color, 6, size, (x, y), True)
+    def draw_grid(self, surface: pygame.Surface) -> None:
+        """
+        Constructs the maze's grid and draws hexagons for each cell on the surface.
+        """
+        s_x, s_y = self.level.content.shape
+        _, hexagon_width, hexagon_height, _, _ = self.get_hexagon_geometry()
+
+        for x_i, y_i in self.level.iterate_over_shape():
+            self.draw_cell(surface, x_i, y_i, self.get_object_color(self.level.content[x_i, y_i]))
 
         # Update viewport
         viewport_name = 'grid'
@@ -62,6 +83,23 @@ class MazeHexagonal(Maze):
         grid_viewport = Viewport(viewport_name, (0, 0, viewport_end_x, viewport_end_y))
         self.viewports[viewport_name] = grid_viewport
 
+    def get_hexagon_size(self) -> int:
+        """
+        Returns the length between the center and any of the edges of the hexagons.
+        """
+        z_x, z_y = self.get_z()
+        return min(z_x, z_y) // 2
+
+    def get_cell_rect(self, x: int, y: int) -> pygame.Rect:
+        size = self.get_hexagon_size()
+        center_x, center_y = self.get_cell_center(x, y)
+        # Includes the border
+        return pygame.Rect(center_x - size - 1, center_y - size - 1, 2 * size + 3, 2 * size + 3)
+
+    def draw_cell(self, surface: pygame.Surface, x: int, y: int, color: Tuple[int, int, int]) -> pygame.Rect:
+        draw_ngon(surface, color, 6, self.get_hexagon_size(), self.get_cell_center(x, y), True)
+        return self.get_cell_rect(x, y)
+
     def get_z(self) -> Tuple[int, int]:
         """
         Computes `z`, which is the size each cell has on the screen (in pixels).
@@ -79,4 +117,5 @@ class MazeHexagonal(Maze):
         return z, z
 
     def get_cell_center(self, x: int, y: int) -> Tuple[int, int]:
-        return self.cells_coordinates_matrix[x, y]
+        center_x, center_y = self.get_cells_coordinates()[x, y]
+        return center_x, center_y
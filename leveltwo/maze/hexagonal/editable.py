@@ -1,10 +1,24 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from .base import MazeHexagonal
+from .base import MazeHexagonal, cube_round
 from ..base import MazeEditable
 
 
 class MazeEditableHexagonal(MazeHexagonal, MazeEditable):
 
-    def get_clicked_cell_index(self, x: int, y: int) -> Tuple[int, int]:
-        pass
+    def get_clicked_cell_index(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """
+        Converts the coordinates to fractional axial coordinates `q` (the column)
+        and `r` (the row, along the columns' diagonal), and rounds them to the nearest hexagon.
+        """
+        size, _, hexagon_height, _, vertical_offset = self.get_hexagon_geometry()
+        if size == 0:
+            return
+        # Inverse of `compute_cells_coordinates()`
+        q = (x - size) / (1.5 * size)
+        r = (y - vertical_offset) / hexagon_height - q / 2
+        q, r = cube_round(q, r)
+        cell_x, cell_y = q, r + q
+        s_x, s_y = self.level.content.shape
+        if 0 <= cell_x < s_x and 0 <= cell_y < s_y and self.level.content[cell_x, cell_y] != 0:
+            return cell_x, cell_y
@@ -7,40 +7,29 @@ from typing import Tuple
 
 from ..base import Maze, Viewport
 
-from ...sprites.object_to_color import ObjectToColor
-
 
 class MazeSquare(Maze, ABC):
 
-    def init_cell_coordinates_matrix(self) -> np.array:
-        return np.empty((self.level.content.shape[0], self.level.content.shape[1], 4))
+    def compute_cells_coordinates(self) -> np.array:
+        """
+        Returns an array of shape `(s_x, s_y, 4)` holding, for each cell,
+        the coordinates of its rectangle: `origin_x, origin_y, end_x, end_y`.
+        """
+        z_x, z_y = self.get_z()
+        x, y = np.indices(self.level.content.shape)
+        origin_x = x * z_x
+        origin_y = y * z_y
+        return np.stack([origin_x, origin_y, origin_x + z_x, origin_y + z_y], axis=-1)
 
-    def draw_grid(self) -> None:
+    def draw_grid(self, surface: pygame.Surface) -> None:
         """
-        Constructs the maze's grid and draws rectangles for each cell on the screen.
+        Constructs the maze's grid and draws rectangles for each cell on the surface.
         """
         z_x, z_y = self.get_z()
         # On the x and y axis, how many cells we want
         s_x, s_y = self.level.content.shape
-        for i_x in range(s_x):
-            for i_y in range(s_y):
-                x = i_x * z_x
-                y = i_y * z_y
-
-                origin_x = x
-                origin_y = y
-                end_x = x + z_x
-                end_y = y + z_y
-
-                self.cells_coordinates_matrix[i_x, i_y] = np.array([origin_x, origin_y, end_x, end_y])
-                cell = self.level.content[i_x, i_y] - 1  # objects are 1-indexed in the level content
-                # Draw the rectangle.
-                rect = pygame.Rect(x, y, z_x, z_y)
-                try:
-                    color = ObjectToColor[self.objects[cell].name].value
-                except IndexError:
-                    color = ObjectToColor('default').value
-                pygame.draw.rect(self.screen, color, rect)
+        for i_x, i_y in np.ndindex(s_x, s_y):
+            self.draw_cell(surface, i_x, i_y, self.get_object_color(self.level.content[i_x, i_y]))
 
         # Update viewport
         viewport_name = 'grid'
@@ -49,6 +38,13 @@ class MazeSquare(Maze, ABC):
         grid_viewport = Viewport(viewport_name, (0, 0, viewport_end_x, viewport_end_y))
         self.viewports[viewport_name] = grid_viewport
 
+    def get_cell_rect(self, x: int, y: int) -> pygame.Rect:
+        z_x, z_y = self.get_z()
+        return pygame.Rect(x * z_x, y * z_y, z_x, z_y)
+
+    def draw_cell(self, surface: pygame.Surface, x: int, y: int, color: Tuple[int, int, int]) -> pygame.Rect:
+        return pygame.draw.rect(surface, color, self.get_cell_rect(x, y))
+
     def get_z(self) -> Tuple[int, int]:
         """
         Computes `z`, which is the size each cell has on the screen (in pixels).
@@ -68,7 +64,7 @@ class MazeSquare(Maze, ABC):
         return z, z
 
     def get_cell_center(self, x: int, y: int) -> Tuple[int, int]:
-        origin_x, origin_y, end_x, end_y = self.cells_coordinates_matrix[x, y]
+        origin_x, origin_y, end_x, end_y = self.get_cells_coordinates()[x, y]
         center_x = origin_x + ((end_x - origin_x) // 2)
         center_y = origin_y + ((end_y - origin_y) // 2)
         return center_x, center_y
@@ -1,6 +1,4 @@
-import numpy as np
-
-from typing import Tuple
+from typing import Optional, Tuple
 
 from .base import MazeSquare
 from ..base import MazeEditable
@@ -8,7 +6,9 @@ from ..base import MazeEditable
 
 class MazeEditableSquare(MazeEditable, MazeSquare):
 
-    def get_clicked_cell_index(self, x: int, y: int) -> Tuple[int, int]:
-        searching_for = self.get_bounds(x, y)
-        cell_index = np.where((self.cells_coordinates_matrix == searching_for).all(axis=2))
-        return int(cell_index[0]), int(cell_index[1])
+    def get_clicked_cell_index(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        z_x, z_y = self.get_z()
+        cell_x, cell_y = x // z_x, y // z_y
+        s_x, s_y = self.level.content.shape
+        if 0 <= cell_x < s_x and 0 <= cell_y < s_y:
+            return cell_x, cell_y
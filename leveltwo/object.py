@@ -7,6 +7,7 @@ import os
 
 from enum import Enum
 from PIL import Image
+from typing import Optional
 
 from .enums import Effects
 from .database.models import ObjectDBO
@@ -42,6 +43,10 @@ class GenericObject:
         The maximum number of this object in any scene.
         Must be superior or equal to `min_instances`.
 
+    cost: int, optional
+        Number of steps (game ticks) it takes to walk on this object.
+        Default depends on the effect, see `get_default_cost()`.
+
     Raises
     ------
 
@@ -60,6 +65,7 @@ class GenericObject:
                  traversable: bool,
                  min_instances: int,
                  max_instances: int,
+                 cost: Optional[int] = None,
                  **kwargs):
 
         # Check types are valid.
@@ -68,7 +74,8 @@ class GenericObject:
                 or not isinstance(effect, Effects) \
                 or not isinstance(traversable, bool) \
                 or not isinstance(min_instances, int) \
-                or not isinstance(max_instances, int):
+                or not isinstance(max_instances, int) \
+                or not isinstance(cost, (int, type(None))):
             raise TypeError
 
         self.identifier = identifier
@@ -77,11 +84,23 @@ class GenericObject:
         self.traversable = traversable
         self.min_instances = min_instances
         self.max_instances = max_instances
+        self.cost = self.get_default_cost(effect) if cost is None else cost
 
         # Setting additional arguments as attributes.
         for key, value in kwargs.items():
             self.__setattr__(key, value)
 
+    @staticmethod
+    def get_default_cost(effect: Effects) -> int:
+        """
+        Number of steps it takes to walk on an object with this effect,
+        used for objects that do not define their own cost.
+        """
+        if effect == Effects.PLAYER_SLOW:
+            # One step to move, and another one stunned.
+            return 2
+        return 1
+
     @classmethod
     def from_dbo(cls, dbo: ObjectDBO):
         """
@@ -94,7 +113,9 @@ class GenericObject:
         traversable = dbo.traversable
         min_instances = dbo.min_instances
         max_instances = dbo.max_instances
-        return cls(identifier, name, effect, traversable, min_instances, max_instances)
+        # Objects stored before costs were added have none
+        cost = dbo.cost
+        return cls(identifier, name, effect, traversable, min_instances, max_instances, cost)
 
     def to_dbo(self) -> ObjectDBO:
         name = self.name
@@ -102,4 +123,5 @@ class GenericObject:
         traversable = self.traversable
         min_instances = self.min_instances
         max_instances = self.max_instances
-        return ObjectDBO(name, effect, traversable, min_instances, max_instances)
+        cost = self.cost
+        return ObjectDBO(name, effect, traversable, min_instances, max_instances, cost)
@@ -0,0 +1,104 @@
+"""
+Implements a headless runner, which solves levels without any display.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple, Type
+
+from .test import Test
+from .level import GenericLevel
+from .character import Character
+from .algorithm.base import MazeSolvingAlgorithm, Manual
+
+
+class RunResult:
+
+    """
+    Holds the outcome of a headless run.
+
+    Parameters
+    ----------
+
+    algorithm: MazeSolvingAlgorithm
+        The algorithm instance, in the state it was when the run ended.
+
+    character: Character
+        The character the algorithm moved around.
+
+    test: Test
+        The test describing the run, ready to be passed to `Database.store_test()`.
+
+    steps_number: int
+        How many times `run_one_step()` was called.
+
+    """
+
+    def __init__(self, algorithm: MazeSolvingAlgorithm, character: Character, test: Test, steps_number: int):
+        self.algorithm = algorithm
+        self.character = character
+        self.test = test
+        self.steps_number = steps_number
+
+    @property
+    def path(self) -> List[Tuple[int, int]]:
+        return self.character.path
+
+    @property
+    def solved(self) -> bool:
+        """
+        Returns whether the character reached the arrival point alive.
+        """
+        arrival = tuple(int(v) for v in self.algorithm.level.get_arrival_point_position())
+        return self.character.is_alive() and tuple(int(v) for v in self.character.location) == arrival
+
+
+class HeadlessRunner:
+
+    """
+    Drives a `MazeSolvingAlgorithm` to completion, as fast as possible,
+    without creating any window.
+
+    Parameters
+    ----------
+
+    level: GenericLevel
+        The level to solve.
+
+    max_steps: int, optional
+        Maximum number of steps an algorithm can take before being stopped.
+        Guards against algorithms that never end.
+        By default, ten times the number of cells in the level.
+
+    """
+
+    def __init__(self, level: GenericLevel, max_steps: Optional[int] = None):
+        self.level = level
+        if max_steps is None:
+            max_steps = 10 * self.level.content.size
+        self.max_steps = max_steps
+
+    def run(self, algorithm_class: Type[MazeSolvingAlgorithm], **kwargs) -> RunResult:
+        """
+        Runs the algorithm on the level until it stops by itself,
+        or until `max_steps` is reached.
+        Additional keyword arguments are passed to the algorithm.
+        """
+        if issubclass(algorithm_class, Manual):
+            raise ValueError(f'Algorithm {algorithm_class.__name__!r} requires a human player, '
+                             f'it cannot run headless.')
+
+        starting_point_location = self.level.get_starting_point_position()
+        character = Character(*starting_point_location)
+        algo = algorithm_class(self.level, character, **kwargs)
+
+        steps_number = 0
+        while algo.is_running() and steps_number < self.max_steps:
+            algo.run_one_step()
+            steps_number += 1
+
+        test = Test(identifier=None,
+                    level_id=self.level.identifier,
+                    algorithm=algo.name,
+                    steps=character.path,
+                    run_date=datetime.now())
+        return RunResult(algo, character, test, steps_number)
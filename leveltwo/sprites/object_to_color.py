@@ -9,3 +9,6 @@ class ObjectToColor(Enum):
     wall = (127, 127, 127)
     mud = (222, 184, 135)
     trap = (127, 0, 0)
+    # Marks left by the algorithms
+    visited = (255, 236, 139)
+    deadend = (205, 133, 63)
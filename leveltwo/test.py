@@ -1,6 +1,9 @@
 from datetime import datetime
 
+import numpy as np
+
 from .database.models import TestDBO
+from .utils import array_to_bytes, bytes_to_array
 
 
 class Test:
@@ -15,13 +18,18 @@ class Test:
     @classmethod
     def from_dbo(cls, dbo: TestDBO):
         """
-        Takes a Levels Database Object (LevelsDBO, see `database/models.py`),
-        and creates a new GenericLevel instance from the information it contains.
+        Takes a Tests Database Object (TestDBO, see `database/models.py`),
+        and creates a new Test instance from the information it contains.
+        If the steps are stored in the object, they are loaded as an array of shape `(n, 2)`,
+        otherwise they have to be filled from the `tests_content` table.
         """
         identifier = dbo.id
         level_id = dbo.level_id
         algorithm = dbo.algorithm
-        steps = [(0, 0) for _ in range(dbo.steps_number)]
+        if dbo.steps_blob is not None:
+            steps = bytes_to_array(dbo.steps_blob, (dbo.steps_number, 2))
+        else:
+            steps = [(0, 0) for _ in range(dbo.steps_number)]
         run_date = dbo.run_date
         return cls(identifier, level_id, algorithm, steps, run_date)
 
@@ -30,7 +38,8 @@ class Test:
         algorithm = self.algorithm
         steps_number = len(self.steps)
         run_date = datetime.now()
-        return TestDBO(level_id, algorithm, steps_number, run_date)
+        steps_blob = array_to_bytes(np.array(self.steps, dtype='int16').reshape((steps_number, 2)))
+        return TestDBO(level_id, algorithm, steps_number, run_date, steps_blob)
 
 
 class TestContent:
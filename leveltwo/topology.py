@@ -0,0 +1,45 @@
+"""
+Describes how cells are laid out and connected, for each level disposition.
+"""
+
+import numpy as np
+
+from typing import Tuple
+
+from .exceptions import InvalidLevelType
+
+
+Offsets = Tuple[Tuple[int, int], ...]
+
+
+# Offsets, on the `x` and `y` axis, from a cell to each of its adjacent cells.
+neighbour_offsets = {
+    # Same order as the directions of `ManualSquare`: up, left, down, right
+    'square': ((0, -1), (-1, 0), (0, 1), (1, 0)),
+    # Same order as the directions of `ManualHexagonal`:
+    # up, left-up, left-down, down, right-down, right-up
+    'hexagonal': ((0, -1), (-1, -1), (-1, 0), (0, 1), (1, 1), (1, 0)),
+}
+
+
+def get_neighbour_offsets(disposition: str) -> Offsets:
+    try:
+        return neighbour_offsets[disposition]
+    except KeyError:
+        raise InvalidLevelType(disposition)
+
+
+def get_cells_mask(disposition: str, shape: Tuple[int, int]) -> np.array:
+    """
+    Returns a boolean array indicating which cells exist in a level of this disposition and shape.
+    Square levels use all their cells, while hexagonal levels are hexagons
+    cut in the array, the cells outside being invalid (`0` in the content).
+    """
+    if disposition == 'square':
+        return np.ones(shape, dtype='bool')
+    elif disposition == 'hexagonal':
+        radius = (min(shape) - 1) // 2
+        x, y = np.indices(shape)
+        return np.abs(y - x) <= radius
+    else:
+        raise InvalidLevelType(disposition)
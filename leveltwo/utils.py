@@ -2,6 +2,12 @@
 Implements utility functions.
 """
 
+import zlib
+
+import numpy as np
+
+from typing import Optional, Tuple
+
 
 def list_to_string(l: list) -> str:
     """
@@ -17,3 +23,32 @@ def string_to_list(s: str) -> list:
     :return list: The actual list.
     """
     return s.split(', ')
+
+
+def array_to_bytes(array: np.array, compression: Optional[str] = None) -> bytes:
+    """
+    :param np.array array: An integer array to serialize.
+    :param str compression: Either None (raw bytes) or 'zlib'.
+    :return bytes: The array, as little-endian int16 bytes, compressed if requested.
+    """
+    data = np.ascontiguousarray(array, dtype='<i2').tobytes()
+    if compression == 'zlib':
+        data = zlib.compress(data)
+    elif compression is not None:
+        raise ValueError(f'Invalid compression {compression!r}')
+    return data
+
+
+def bytes_to_array(data: bytes, shape: Tuple[int, ...], compression: Optional[str] = None) -> np.array:
+    """
+    :param bytes data: An array serialized with `array_to_bytes()`.
+    :param tuple shape: The shape of the array.
+    :param str compression: The compression used when serializing.
+    :return np.array: The actual array, as int16.
+    """
+    if compression == 'zlib':
+        data = zlib.decompress(data)
+    elif compression is not None:
+        raise ValueError(f'Invalid compression {compression!r}')
+    # The buffer is copied once, so that the array is writable.
+    return np.frombuffer(bytearray(data), dtype='<i2').reshape(shape)